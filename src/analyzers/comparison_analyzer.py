@@ -16,6 +16,11 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
 from scikit_posthocs import posthoc_dunn
+from functools import reduce
+from joblib import Parallel, delayed
+import joblib
+import hashlib
+import io
 import os
 import sys
 
@@ -25,6 +30,60 @@ from core.base_analyzer import ComparisonAnalyzer
 from core.academic_writer import AcademicWriter
 from config import analysis_config as config
 
+# Numba is optional: the significance kernel falls back to the fused
+# NumPy expression when it is not installed
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# Explicit column schemas so comparison DataFrames are built with
+# from_records + astype instead of per-cell type inference
+_DESC_COLS = ['city', 'n_samples', 'n_features'] + \
+             [f'{t}_n_significant' for t in config.TARGETS]
+_DESC_DTYPES = {'city': 'string', 'n_samples': 'Int64', 'n_features': 'Int64',
+                **{f'{t}_n_significant': 'Int64' for t in config.TARGETS}}
+
+_CLUSTER_COLS = ['city', 'n_components', 'variance_explained', 'optimal_k', 'silhouette'] + \
+                [f'{t}_kruskal_p' for t in config.TARGETS]
+_CLUSTER_DTYPES = {'city': 'string', 'n_components': 'Int64', 'variance_explained': 'float64',
+                   'optimal_k': 'Int64', 'silhouette': 'float64',
+                   **{f'{t}_kruskal_p': 'float64' for t in config.TARGETS}}
+
+
+if _HAS_NUMBA:
+    # No fastmath: the matrices are NaN-filled for features a city lacks,
+    # and those cells must fail the significance comparisons below.
+    @njit(cache=True)
+    def _sig_kernel(corr_matrix, pval_matrix, rho_threshold, p_threshold):
+        """
+        Fused significance reduction over the (n_cities, n_features) matrices.
+
+        Computes per-feature significant-city counts and the all-cities
+        (universal) mask in one pass, without the four boolean temporaries
+        the equivalent NumPy expression allocates. Kept serial so it can be
+        invoked safely from the per-target joblib threads.
+        """
+        n_cities, n_features = corr_matrix.shape
+        counts = np.zeros(n_features, dtype=np.int32)
+        universal = np.empty(n_features, dtype=np.bool_)
+
+        for i in range(n_features):
+            c = 0
+            all_significant = True
+            for j in range(n_cities):
+                significant = (abs(corr_matrix[j, i]) > rho_threshold) and \
+                              (pval_matrix[j, i] < p_threshold)
+                if significant:
+                    c += 1
+                else:
+                    all_significant = False
+            counts[i] = c
+            universal[i] = all_significant
+
+        return counts, universal
+
 
 class CrossCityComparisonAnalyzer(ComparisonAnalyzer):
     """
@@ -36,7 +95,7 @@ class CrossCityComparisonAnalyzer(ComparisonAnalyzer):
         super().__init__(name='comparison')
         self.writer = AcademicWriter()
 
-    def analyze(self, city_results, **kwargs):
+    def analyze(self, city_results, use_cache=True, **kwargs):
         """
         Perform cross-city comparison analysis.
 
@@ -45,6 +104,9 @@ class CrossCityComparisonAnalyzer(ComparisonAnalyzer):
         city_results : dict
             Dictionary of {city_key: {analysis_results}}
             Each city's results should contain 'statistical', 'pca_clustering', 'lag_rolling'
+        use_cache : bool, default=True
+            Reuse disk-cached comparison results when the per-city inputs
+            are unchanged (content-hash keyed, see COMPARISON_CACHE_DIR)
 
         Returns
         -------
@@ -55,6 +117,20 @@ class CrossCityComparisonAnalyzer(ComparisonAnalyzer):
         print(f"Cross-City Comparison Analysis")
         print(f"{'='*60}")
 
+        # Content-hash-keyed disk cache: re-runs with unchanged upstream
+        # city results return immediately instead of recomputing
+        cache_path = None
+        if use_cache:
+            cache_key = self._city_results_key(city_results)
+            os.makedirs(config.COMPARISON_CACHE_DIR, exist_ok=True)
+            cache_path = os.path.join(config.COMPARISON_CACHE_DIR,
+                                      f'{cache_key}.joblib')
+            if os.path.exists(cache_path):
+                print("✓ Inputs unchanged; loading cached comparison results")
+                self.results = joblib.load(cache_path)
+                os.utime(cache_path)  # refresh recency for LRU eviction
+                return self.results
+
         results = {
             'n_cities': len(city_results),
             'cities': list(city_results.keys())
@@ -62,206 +138,332 @@ class CrossCityComparisonAnalyzer(ComparisonAnalyzer):
 
         print(f"✓ Comparing {len(city_results)} cities")
 
-        # 1. Compare descriptive statistics
-        print("\n1. Comparing descriptive statistics...")
-        desc_comp = self._compare_descriptive_stats(city_results)
-        results['descriptive_comparison'] = desc_comp
+        # Precompute the (city_key, name_en, results) fixture once so the
+        # _compare_* helpers don't re-walk config.CITIES and city_results
+        self._active_cities = [(city_key, config.CITIES[city_key]['name_en'], city_results[city_key])
+                               for city_key in self.city_order if city_key in city_results]
 
-        # 2. Compare feature importance
-        print("\n2. Comparing feature importance rankings...")
-        feature_comp = self._compare_feature_importance(city_results)
-        results['feature_comparison'] = feature_comp
+        # Memoized ndarray views of each city's correlation results:
+        # {(city_key, target): (corr_array, pval_array, feature_index)}
+        self._stat_cache = {}
 
-        # 3. Identify universal vs city-specific predictors
-        print("\n3. Identifying universal and city-specific predictors...")
-        predictor_comp = self._identify_predictors(city_results)
-        results.update(predictor_comp)
+        # Single fused pass over city results: accumulate inputs for all
+        # five comparisons at once instead of re-walking the nested dicts
+        # per comparison
+        print("\nCollecting per-city results (single pass)...")
+        targets = config.TARGETS
 
-        # 4. Compare clustering results
-        print("\n4. Comparing clustering patterns...")
-        cluster_comp = self._compare_clustering(city_results)
-        results['clustering_comparison'] = cluster_comp
+        stats_list = []
+        feature_inputs = {target: [] for target in targets}
+        predictor_inputs = {target: [] for target in targets}
+        cluster_list = []
+        lag_inputs = {target: [] for target in targets}
+
+        for city_key, city_name, city_res in self._active_cities:
+            stat_res = city_res.get('statistical')
+            pca_res = city_res.get('pca_clustering')
+            lag_res = city_res.get('lag_rolling')
+
+            # Early exit: a city with no usable results contributes nothing,
+            # so skip it before building any per-city structures
+            if not stat_res and not pca_res and not lag_res:
+                continue
+
+            # 1. Descriptive statistics (tuple rows in _DESC_COLS order)
+            if stat_res:
+                stats_list.append(
+                    (city_name,
+                     stat_res.get('n_samples', np.nan),
+                     stat_res.get('n_features', np.nan))
+                    + tuple(stat_res.get(f'{target}_n_significant', np.nan)
+                            for target in targets)
+                )
+
+                for target in targets:
+                    # 2. Top feature rankings (frames collected, concatenated
+                    # once per target after the loop)
+                    if f'{target}_top_positive' in stat_res:
+                        feature_inputs[target].append(
+                            (city_name,
+                             stat_res[f'{target}_top_positive'].head(10),
+                             stat_res[f'{target}_top_negative'].head(10))
+                        )
+
+                    # 3. Correlation/p-value arrays for predictor identification,
+                    # converted from pandas Series exactly once per city/target
+                    if f'{target}_correlations' in stat_res:
+                        corr = stat_res[f'{target}_correlations']
+                        pval = stat_res[f'{target}_p_values']
+                        cached = (corr.to_numpy(np.float32),
+                                  pval.to_numpy(np.float32),
+                                  corr.index)
+                        self._stat_cache[(city_key, target)] = cached
+                        predictor_inputs[target].append((city_name,) + cached)
+
+            # 4. Clustering results (tuple rows in _CLUSTER_COLS order)
+            if pca_res:
+                cluster_list.append(
+                    (city_name,
+                     pca_res.get('n_components', np.nan),
+                     pca_res.get('total_variance_explained', np.nan),
+                     pca_res.get('optimal_k', np.nan),
+                     pca_res.get('optimal_silhouette', np.nan))
+                    + tuple(pca_res.get(f'{target}_kruskal_p', np.nan)
+                            for target in targets)
+                )
 
-        # 5. Compare lag patterns
-        print("\n5. Comparing temporal lag patterns...")
-        lag_comp = self._compare_lag_patterns(city_results)
-        results['lag_comparison'] = lag_comp
+            # 5. Optimal lag tables
+            if lag_res:
+                for target in targets:
+                    if f'{target}_optimal_lags' in lag_res:
+                        # assign() adds the city column without copying blocks
+                        lag_inputs[target].append(
+                            lag_res[f'{target}_optimal_lags'].assign(city=city_name)
+                        )
+
+        # Project-wide categorical dtype over every observed feature name:
+        # downstream set logic runs on int32 codes instead of re-hashing
+        # the same label strings per target
+        all_feature_names = reduce(
+            pd.Index.union,
+            (idx for entries in predictor_inputs.values() for _, _, _, idx in entries),
+            pd.Index([])
+        )
+        self._feature_dtype = pd.CategoricalDtype(all_feature_names)
+
+        # Post-process accumulated inputs outside the loop
+        print("\nIdentifying universal and city-specific predictors...")
+        results['descriptive_comparison'] = pd.DataFrame.from_records(
+            stats_list, columns=_DESC_COLS).astype(_DESC_DTYPES, copy=False)
+        results['feature_comparison'] = self._combine_feature_importance(feature_inputs)
+        results.update(self._identify_predictors(predictor_inputs))
+        results['clustering_comparison'] = pd.DataFrame.from_records(
+            cluster_list, columns=_CLUSTER_COLS).astype(_CLUSTER_DTYPES, copy=False)
+        results['lag_comparison'] = {target: pd.concat(city_lags, ignore_index=True)
+                                     for target, city_lags in lag_inputs.items() if city_lags}
 
         # Store results
         self.results = results
 
+        if cache_path is not None:
+            joblib.dump(results, cache_path)
+            self._evict_cache(config.COMPARISON_CACHE_DIR,
+                              config.COMPARISON_CACHE_MAX_ENTRIES)
+
         print(f"\n{'='*60}")
         print(f"✓ Cross-city comparison complete")
         print(f"{'='*60}\n")
 
         return results
 
-    def _compare_descriptive_stats(self, city_results):
-        """Compare basic descriptive statistics across cities."""
-        stats_list = []
-
-        for city_key in self.city_order:
-            if city_key not in city_results:
-                continue
-
-            city_name = config.CITIES[city_key]['name_en']
-
-            # Get statistical results
-            if 'statistical' in city_results[city_key]:
-                stat_res = city_results[city_key]['statistical']
-
-                row = {
-                    'city': city_name,
-                    'n_samples': stat_res.get('n_samples', np.nan),
-                    'n_features': stat_res.get('n_features', np.nan)
-                }
+    @staticmethod
+    def _city_results_key(city_results):
+        """
+        Content hash of the nested city_results structure.
 
-                # Add POS/EGG statistics if available
-                for target in config.TARGETS:
-                    if f'{target}_n_significant' in stat_res:
-                        row[f'{target}_n_significant'] = stat_res[f'{target}_n_significant']
+        DataFrames and Series are hashed via pandas' row hashes and numpy
+        arrays through their raw bytes (plus dtype and shape) so the key
+        changes with the data, not with object identity; remaining scalar
+        values are hashed through their repr.
 
-                stats_list.append(row)
+        Parameters
+        ----------
+        city_results : dict
+            Dictionary of {city_key: {analysis_results}}
 
-        return pd.DataFrame(stats_list)
+        Returns
+        -------
+        str
+            Hex digest usable as a cache filename
+        """
+        digest = hashlib.md5()
+        for city_key in sorted(city_results):
+            digest.update(city_key.encode())
+            for analysis_type in sorted(city_results[city_key]):
+                digest.update(analysis_type.encode())
+                analysis_res = city_results[city_key][analysis_type]
+                if not analysis_res:
+                    continue
+                for name in sorted(analysis_res):
+                    digest.update(name.encode())
+                    value = analysis_res[name]
+                    if isinstance(value, (pd.DataFrame, pd.Series)):
+                        digest.update(
+                            pd.util.hash_pandas_object(value, index=True)
+                            .to_numpy().tobytes()
+                        )
+                    elif isinstance(value, np.ndarray):
+                        # repr truncates large arrays, so hash the raw
+                        # bytes; dtype and shape disambiguate layouts
+                        digest.update(str(value.dtype).encode())
+                        digest.update(repr(value.shape).encode())
+                        digest.update(np.ascontiguousarray(value).tobytes())
+                    else:
+                        digest.update(repr(value).encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _evict_cache(cache_dir, max_entries):
+        """Drop the least recently used cache files beyond max_entries."""
+        entries = sorted(
+            (os.path.join(cache_dir, f) for f in os.listdir(cache_dir)
+             if f.endswith('.joblib')),
+            key=os.path.getmtime
+        )
+        for path in entries[:-max_entries]:
+            os.remove(path)
 
-    def _compare_feature_importance(self, city_results):
-        """Compare top feature rankings across cities."""
-        comparison = {}
+    def _combine_feature_importance(self, feature_inputs):
+        """
+        Combine per-city top positive/negative features with one concat per target.
 
-        for target in config.TARGETS:
-            # Collect top features from each city
-            city_top_features = {}
+        Parameters
+        ----------
+        feature_inputs : dict
+            {target: [(city_name, top_positive, top_negative), ...]}
 
-            for city_key in self.city_order:
-                if city_key not in city_results:
-                    continue
+        Returns
+        -------
+        dict
+            {target: {city_name: combined_top_features}}
+        """
+        targets = list(feature_inputs.keys())
 
-                city_name = config.CITIES[city_key]['name_en']
+        # Targets are independent; the concat work runs in threads (pandas
+        # releases the GIL for the underlying block copies)
+        combined = Parallel(n_jobs=max(len(targets), 1), prefer='threads')(
+            delayed(self._combine_target_features)(feature_inputs[target])
+            for target in targets
+        )
 
-                if 'statistical' in city_results[city_key]:
-                    stat_res = city_results[city_key]['statistical']
+        return dict(zip(targets, combined))
 
-                    if f'{target}_top_positive' in stat_res:
-                        top_pos = stat_res[f'{target}_top_positive'].head(10)
-                        top_neg = stat_res[f'{target}_top_negative'].head(10)
+    @staticmethod
+    def _combine_target_features(entries):
+        """Combine one target's per-city top features with a single concat."""
+        if not entries:
+            return {}
 
-                        # Combine and store
-                        top_combined = pd.concat([top_pos, top_neg])
-                        city_top_features[city_name] = top_combined
+        # One concat per target instead of one per city
+        city_names = [name for name, _, _ in entries]
+        frames = [frame for _, top_pos, top_neg in entries for frame in (top_pos, top_neg)]
+        combined = pd.concat(frames, keys=np.repeat(city_names, 2))
 
-            comparison[target] = city_top_features
+        return {name: combined.loc[name] for name in city_names}
 
-        return comparison
+    def _identify_predictors(self, predictor_inputs):
+        """
+        Identify universal vs city-specific predictors.
 
-    def _identify_predictors(self, city_results):
-        """Identify universal vs city-specific predictors."""
+        Parameters
+        ----------
+        predictor_inputs : dict
+            {target: [(city_name, corr_array, pval_array, feature_index), ...]}
+            accumulated during the fused pass in analyze()
+        """
         universal_predictors = {}
         city_specific_predictors = {}
 
-        for target in config.TARGETS:
-            # Collect significant features from each city
-            city_significant = {}
-
-            for city_key in self.city_order:
-                if city_key not in city_results:
-                    continue
-
-                city_name = config.CITIES[city_key]['name_en']
+        # Hoist threshold lookups out of the per-target dispatch
+        rho_threshold = config.UNIVERSAL_PREDICTOR_RHO_THRESHOLD
+        p_threshold = config.UNIVERSAL_PREDICTOR_P_THRESHOLD
 
-                if 'statistical' in city_results[city_key]:
-                    stat_res = city_results[city_key]['statistical']
+        targets = [target for target, entries in predictor_inputs.items() if entries]
 
-                    if f'{target}_correlations' in stat_res:
-                        corr = stat_res[f'{target}_correlations']
-                        pval = stat_res[f'{target}_p_values']
-
-                        # Features meeting universal criteria
-                        significant = (np.abs(corr) > config.UNIVERSAL_PREDICTOR_RHO_THRESHOLD) & \
-                                    (pval < config.UNIVERSAL_PREDICTOR_P_THRESHOLD)
-
-                        city_significant[city_name] = set(corr[significant].index)
-
-            # Find universal predictors (in all cities)
-            if city_significant:
-                universal = set.intersection(*city_significant.values())
-                universal_predictors[target] = list(universal)
-
-                print(f"  {target.upper()}: {len(universal)} universal predictors")
-
-                # Find city-specific (in 1-2 cities only)
-                all_features = set.union(*city_significant.values())
-                city_specific = {}
-
-                for feature in all_features:
-                    cities_with_feature = [city for city, features in city_significant.items()
-                                         if feature in features]
-
-                    if 1 <= len(cities_with_feature) <= 2:
-                        city_specific[feature] = cities_with_feature
+        if targets:
+            # Per-target work shares the inputs read-only, so threads suffice
+            outputs = Parallel(n_jobs=len(targets), prefer='threads')(
+                delayed(self._identify_target_predictors)(
+                    predictor_inputs[target], self._feature_dtype,
+                    rho_threshold, p_threshold)
+                for target in targets
+            )
 
+            for target, (universal, city_specific) in zip(targets, outputs):
+                universal_predictors[target] = universal
                 city_specific_predictors[target] = city_specific
+                print(f"  {target.upper()}: {len(universal)} universal predictors")
 
         return {
             'universal_predictors': universal_predictors,
             'city_specific_predictors': city_specific_predictors
         }
 
-    def _compare_clustering(self, city_results):
-        """Compare clustering results across cities."""
-        comparison = []
-
-        for city_key in self.city_order:
-            if city_key not in city_results:
-                continue
-
-            city_name = config.CITIES[city_key]['name_en']
-
-            if 'pca_clustering' in city_results[city_key]:
-                pca_res = city_results[city_key]['pca_clustering']
-
-                row = {
-                    'city': city_name,
-                    'n_components': pca_res.get('n_components', np.nan),
-                    'variance_explained': pca_res.get('total_variance_explained', np.nan),
-                    'optimal_k': pca_res.get('optimal_k', np.nan),
-                    'silhouette': pca_res.get('optimal_silhouette', np.nan)
-                }
-
-                # Add cluster-outcome test results
-                for target in config.TARGETS:
-                    if f'{target}_kruskal_p' in pca_res:
-                        row[f'{target}_kruskal_p'] = pca_res[f'{target}_kruskal_p']
-
-                comparison.append(row)
-
-        return pd.DataFrame(comparison)
-
-    def _compare_lag_patterns(self, city_results):
-        """Compare optimal lag periods across cities."""
-        comparison = {}
-
-        for target in config.TARGETS:
-            city_lags = []
-
-            for city_key in self.city_order:
-                if city_key not in city_results:
-                    continue
-
-                city_name = config.CITIES[city_key]['name_en']
-
-                if 'lag_rolling' in city_results[city_key]:
-                    lag_res = city_results[city_key]['lag_rolling']
-
-                    if f'{target}_optimal_lags' in lag_res:
-                        optimal_df = lag_res[f'{target}_optimal_lags'].copy()
-                        optimal_df['city'] = city_name
-                        city_lags.append(optimal_df)
+    @staticmethod
+    def _identify_target_predictors(entries, feature_dtype, rho_threshold, p_threshold):
+        """
+        Identify universal and city-specific predictors for one target.
 
-            if city_lags:
-                comparison[target] = pd.concat(city_lags, ignore_index=True)
+        Parameters
+        ----------
+        entries : list
+            [(city_name, corr_array, pval_array, feature_index), ...]
+        feature_dtype : pandas.CategoricalDtype
+            Shared categorical over all observed feature names
+        rho_threshold : float
+            Minimum |ρ| for a universal predictor
+        p_threshold : float
+            Maximum p-value for a universal predictor
 
-        return comparison
+        Returns
+        -------
+        list
+            Universal predictor feature names
+        dict
+            {feature: [city_names]} for features significant in 1-2 cities
+        """
+        city_names = [name for name, _, _, _ in entries]
+
+        # Single-city short-circuit: every significant feature is trivially
+        # both universal and city-specific, so skip alignment and stacking
+        if len(entries) == 1:
+            _, corr_arr, pval_arr, idx = entries[0]
+            significant = idx[(corr_arr ** 2 > rho_threshold ** 2) &
+                              (pval_arr < p_threshold)]
+            return list(significant), {feature: [city_names[0]]
+                                       for feature in significant}
+
+        # Align all cities on the shared categorical's integer codes and
+        # stack into dense (n_cities, n_features) float32 arrays; missing
+        # features stay NaN and fail the significance comparison below
+        feature_index = feature_dtype.categories
+        corr_matrix = np.full((len(entries), len(feature_index)), np.nan, dtype=np.float32)
+        pval_matrix = np.full_like(corr_matrix, np.nan)
+
+        for row, (_, corr_arr, pval_arr, idx) in enumerate(entries):
+            codes = idx.astype(feature_dtype).codes
+            corr_matrix[row, codes] = corr_arr
+            pval_matrix[row, codes] = pval_arr
+
+        # Per-feature significant-city counts and universal mask
+        if _HAS_NUMBA:
+            counts, universal_mask = _sig_kernel(corr_matrix, pval_matrix,
+                                                 rho_threshold, p_threshold)
+        else:
+            # Fused NumPy fallback: squaring replaces np.abs (monotonic for
+            # a positive threshold) and out= buffers avoid extra temporaries
+            buf = np.multiply(corr_matrix, corr_matrix)
+            sig_matrix = np.greater(buf, rho_threshold * rho_threshold, out=np.empty(buf.shape, dtype=bool))
+            pval_mask = np.less(pval_matrix, p_threshold, out=np.empty(buf.shape, dtype=bool))
+            np.logical_and(sig_matrix, pval_mask, out=sig_matrix)
+            counts = sig_matrix.sum(axis=0)
+            universal_mask = sig_matrix.all(axis=0)
+
+        # Universal predictors: significant in every city
+        universal = list(feature_index[universal_mask])
+
+        # City-specific: significant in 1-2 cities only; the per-city mask is
+        # only materialized for the few qualifying columns
+        specific_ids = np.where((counts >= 1) & (counts <= 2))[0]
+        specific_sig = (corr_matrix[:, specific_ids] ** 2 > rho_threshold ** 2) & \
+                       (pval_matrix[:, specific_ids] < p_threshold)
+
+        city_specific = {}
+        for col, fid in enumerate(specific_ids):
+            city_specific[feature_index[fid]] = [city_names[c]
+                                                 for c in np.where(specific_sig[:, col])[0]]
+
+        return universal, city_specific
 
     def generate_methods_section(self):
         """Generate Methods section."""
@@ -275,53 +477,67 @@ class CrossCityComparisonAnalyzer(ComparisonAnalyzer):
 
     def generate_results_section(self):
         """Generate Results section."""
-        if not self.results:
+        results = self.results
+        if not results:
             raise ValueError("No analysis results available. Run analyze() first.")
 
-        lines = []
+        # StringIO buffer instead of list-append + join; each write adds the
+        # separating newline, which is trimmed from the final fragment below
+        buf = io.StringIO()
+        write = buf.write
 
         # Header
-        lines.append(f"## Cross-City Comparison\n")
+        write(f"## Cross-City Comparison\n\n")
 
         # Descriptive comparison
-        if 'descriptive_comparison' in self.results:
-            desc_df = self.results['descriptive_comparison']
+        if 'descriptive_comparison' in results:
+            desc_df = results['descriptive_comparison']
 
-            lines.append(f"### Sample Characteristics\n")
-            lines.append(f"\n{desc_df.to_markdown(index=False)}\n")
+            write(f"### Sample Characteristics\n\n")
+            write(f"\n{self.writer._dataframe_to_markdown(desc_df)}\n\n")
 
         # Universal predictors
-        if 'universal_predictors' in self.results:
-            lines.append(f"\n### Universal Predictors\n")
+        if 'universal_predictors' in results:
+            write(f"\n### Universal Predictors\n\n")
 
-            for target, predictors in self.results['universal_predictors'].items():
-                lines.append(f"\n**{target.upper()}**: {len(predictors)} universal predictors found "
-                           f"across all cities (|ρ| > {config.UNIVERSAL_PREDICTOR_RHO_THRESHOLD}, "
-                           f"p < {config.UNIVERSAL_PREDICTOR_P_THRESHOLD}):")
+            for target, predictors in results['universal_predictors'].items():
+                write(f"\n**{target.upper()}**: {len(predictors)} universal predictors found "
+                      f"across all cities (|ρ| > {config.UNIVERSAL_PREDICTOR_RHO_THRESHOLD}, "
+                      f"p < {config.UNIVERSAL_PREDICTOR_P_THRESHOLD}):\n")
 
                 if len(predictors) > 0:
                     for pred in predictors[:10]:  # Show top 10
-                        lines.append(f"- {pred}")
+                        write(f"- {pred}\n")
 
         # Clustering comparison
-        if 'clustering_comparison' in self.results:
-            cluster_df = self.results['clustering_comparison']
+        if 'clustering_comparison' in results:
+            cluster_df = results['clustering_comparison']
 
-            lines.append(f"\n### Clustering Patterns\n")
-            lines.append(f"\n{cluster_df.to_markdown(index=False)}\n")
+            write(f"\n### Clustering Patterns\n\n")
+            write(f"\n{self.writer._dataframe_to_markdown(cluster_df)}\n\n")
 
         # Lag comparison
-        if 'lag_comparison' in self.results:
-            lines.append(f"\n### Temporal Lag Patterns\n")
+        if 'lag_comparison' in results:
+            write(f"\n### Temporal Lag Patterns\n\n")
 
-            for target, lag_df in self.results['lag_comparison'].items():
-                lines.append(f"\n**{target.upper()}**: Comparison of optimal lag periods across cities "
-                           f"(see supplementary tables)")
+            for target, lag_df in results['lag_comparison'].items():
+                write(f"\n**{target.upper()}**: Comparison of optimal lag periods across cities "
+                      f"(see supplementary tables)\n")
+
+        return buf.getvalue()[:-1]
 
-        return "\n".join(lines)
+    def save_outputs(self, output_dir, write_markdown=True):
+        """
+        Save all outputs.
 
-    def save_outputs(self, output_dir):
-        """Save all outputs."""
+        Parameters
+        ----------
+        output_dir : str
+            Output directory
+        write_markdown : bool, default=True
+            Whether to generate and save the methods/results markdown
+            sections; disable for CSV-only runs to skip table formatting
+        """
         if not self.results:
             raise ValueError("No results to save. Run analyze() first.")
 
@@ -338,12 +554,23 @@ class CrossCityComparisonAnalyzer(ComparisonAnalyzer):
                 'descriptive_stats.csv'
             )
 
-        # Feature comparison
+        # Feature comparison (one long-format file per target instead of
+        # one small file per city: fewer opens, single CSV encoder warmup)
         if 'feature_comparison' in self.results:
             for target, city_features in self.results['feature_comparison'].items():
-                for city, features in city_features.items():
-                    filename = f'top_features_{target}_{city.lower().replace(" ", "_")}.csv'
-                    self._save_dataframe(features, output_dir, filename)
+                if not city_features:
+                    # No city contributed features for this target (e.g.
+                    # statistical results absent everywhere) — nothing to
+                    # write, and concat would raise on an empty dict
+                    continue
+                combined = pd.concat(
+                    {city: features for city, features in city_features.items()},
+                    names=['city', 'rank']
+                ).reset_index()
+                saved_files[f'top_features_{target}'] = self._save_dataframe(
+                    combined, output_dir, f'top_features_{target}.csv',
+                    float_format='%.6g'
+                )
 
         # Universal predictors
         if 'universal_predictors' in self.results:
@@ -368,12 +595,13 @@ class CrossCityComparisonAnalyzer(ComparisonAnalyzer):
                     lag_df, output_dir, f'lag_comparison_{target}.csv'
                 )
 
-        # Academic sections
-        methods_text = self.generate_methods_section()
-        results_text = self.generate_results_section()
+        # Academic sections (lazily generated only when requested)
+        if write_markdown:
+            methods_text = self.generate_methods_section()
+            results_text = self.generate_results_section()
 
-        saved_files['methods'] = self._save_text(methods_text, output_dir, 'methods.md')
-        saved_files['results'] = self._save_text(results_text, output_dir, 'results.md')
+            saved_files['methods'] = self._save_text(methods_text, output_dir, 'methods.md')
+            saved_files['results'] = self._save_text(results_text, output_dir, 'results.md')
 
         print(f"✓ Saved {len(saved_files)} files")
 
@@ -12,10 +12,12 @@ This module implements:
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import matplotlib
+matplotlib.use('Agg')  # headless raster backend; no GUI event-loop overhead
 from scipy import stats
+from joblib import Parallel, delayed
 import os
+import re
 import sys
 
 # Add parent directories to path
@@ -25,6 +27,96 @@ from core.academic_writer import AcademicWriter
 from core.data_loader import DataLoader
 from config import analysis_config as config
 
+# Numba is optional: the NaN-aware Spearman kernel falls back to pandas'
+# Cython path when it is not installed
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# cuDF is optional as well: on hosts with a CUDA GPU, large correlation
+# blocks are offloaded to the device in one call (see
+# _analyze_lag_features); everywhere else the CPU paths below are used
+try:
+    import cudf
+    _HAS_CUDF = True
+except ImportError:
+    _HAS_CUDF = False
+
+# Lag feature names end in their week number across all naming conventions
+_WEEK_SUFFIX_RE = re.compile(r'(\d+)$')
+
+
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _rank_average(values):
+        """Average-tie ranks (1-based), as Spearman requires."""
+        order = np.argsort(values)
+        ranks = np.empty(values.size, dtype=np.float64)
+        i = 0
+        while i < values.size:
+            j = i
+            while j + 1 < values.size and \
+                    values[order[j + 1]] == values[order[i]]:
+                j += 1
+            avg_rank = 0.5 * (i + j) + 1.0
+            for k in range(i, j + 1):
+                ranks[order[k]] = avg_rank
+            i = j + 1
+        return ranks
+
+    @njit(cache=True)
+    def _nan_spearman(x, y):
+        """
+        Spearman correlation of x vs y, ignoring pairs where y is NaN.
+
+        x is expected NaN-free (the target column is pre-filtered). No
+        fastmath: the kernel relies on well-defined NaN comparisons.
+        Returns (correlation, n_pairs).
+        """
+        n = 0
+        for i in range(y.size):
+            if not np.isnan(y[i]):
+                n += 1
+        if n < 2:
+            return np.nan, n
+
+        xm = np.empty(n, dtype=np.float64)
+        ym = np.empty(n, dtype=np.float64)
+        k = 0
+        for i in range(y.size):
+            if not np.isnan(y[i]):
+                xm[k] = x[i]
+                ym[k] = y[i]
+                k += 1
+
+        rx = _rank_average(xm)
+        ry = _rank_average(ym)
+
+        # Single-pass reduced-operation Pearson: five running sums, one
+        # load per element, no centering pass. Ranks are bounded by n, so
+        # the uncentered sums stay well within double precision
+        sx = 0.0
+        sy = 0.0
+        sxx = 0.0
+        syy = 0.0
+        sxy = 0.0
+        for i in range(n):
+            vx = rx[i]
+            vy = ry[i]
+            sx += vx
+            sy += vy
+            sxx += vx * vx
+            syy += vy * vy
+            sxy += vx * vy
+
+        var_x = n * sxx - sx * sx
+        var_y = n * syy - sy * sy
+        if var_x <= 0.0 or var_y <= 0.0:
+            return np.nan, n
+        return (n * sxy - sx * sy) / np.sqrt(var_x * var_y), n
+
 
 class LagRollingAnalyzer(CityAnalyzer):
     """
@@ -36,6 +128,9 @@ class LagRollingAnalyzer(CityAnalyzer):
         super().__init__(name='lag_rolling')
         self.writer = AcademicWriter()
         self.loader = DataLoader()
+        # Memoized loader.get_lag_features results, keyed by
+        # (id(df), variable, lag_type); cleared at the end of analyze()
+        self._lag_feature_cache = {}
 
     def analyze(self, df, city_key=None, **kwargs):
         """
@@ -88,31 +183,52 @@ class LagRollingAnalyzer(CityAnalyzer):
 
             print(f"  ✓ Analyzed {len(config.LAG_VARIABLES)} variables × {len(config.LAG_RANGE)} lag periods")
 
-            # Create visualizations
-            fig_heatmap_simple = self._create_lag_heatmap(
-                lag_results, target, 'Simple Lag', city_name
-            )
-            self.figures[f'{target}_heatmap_simple'] = fig_heatmap_simple
+            # Create visualizations, rendered to PNG bytes immediately so
+            # the live Figure objects (MBs each) are freed right away.
+            # Headless sweeps can skip the plotting (and the pyplot
+            # import) entirely via config.GENERATE_FIGURES
+            if getattr(config, 'GENERATE_FIGURES', True):
+                fig_heatmap_simple = self._create_lag_heatmap(
+                    lag_results, target, 'Simple Lag', city_name
+                )
+                self.figures[f'{target}_heatmap_simple'] = self._render_figure(fig_heatmap_simple)
 
-            fig_heatmap_rolling = self._create_lag_heatmap(
-                rolling_results, target, 'Rolling Window', city_name
-            )
-            self.figures[f'{target}_heatmap_rolling'] = fig_heatmap_rolling
+                fig_heatmap_rolling = self._create_lag_heatmap(
+                    rolling_results, target, 'Rolling Window', city_name
+                )
+                self.figures[f'{target}_heatmap_rolling'] = self._render_figure(fig_heatmap_rolling)
 
-            fig_line_plots = self._create_lag_line_plots(
-                lag_results, rolling_results, target, city_name
-            )
-            self.figures[f'{target}_line_plots'] = fig_line_plots
+                fig_line_plots = self._create_lag_line_plots(
+                    lag_results, rolling_results, target, city_name
+                )
+                self.figures[f'{target}_line_plots'] = self._render_figure(fig_line_plots)
 
         # Store results
         self.results = results
 
+        # Drop the per-DataFrame feature cache; it is only valid while
+        # this df is alive (keys include id(df))
+        self._lag_feature_cache.clear()
+
         print(f"\n{'='*60}")
         print(f"✓ Lag/rolling analysis complete")
         print(f"{'='*60}\n")
 
         return results
 
+    def _cached_lag_features(self, df, variable, lag_type):
+        """
+        Memoized wrapper around loader.get_lag_features.
+
+        The same (df, variable, lag_type) lookup is repeated for every
+        target; caching it removes the redundant column-name scans.
+        """
+        key = (id(df), variable, lag_type)
+        if key not in self._lag_feature_cache:
+            self._lag_feature_cache[key] = self.loader.get_lag_features(
+                df, variable, lag_type=lag_type)
+        return self._lag_feature_cache[key]
+
     def _analyze_lag_features(self, df, target, lag_type='simple'):
         """
         Analyze correlations for lag features.
@@ -131,61 +247,224 @@ class LagRollingAnalyzer(CityAnalyzer):
         pandas.DataFrame
             Correlation matrix (variables × lag weeks)
         """
-        correlation_matrix = []
+        pending = []
+
+        # First pass: resolve feature names per variable and lag week. All
+        # naming conventions (variable_lag_{week}, NDVImean_lag{week},
+        # variable_lag_rolling{week}, NDVI rolling aggregates) end in the
+        # week number, so parsing the trailing digits once per feature
+        # replaces the per-week suffix scan
+        resolved = []
 
         for variable in config.LAG_VARIABLES:
             # Get lag features for this variable
-            lag_features = self.loader.get_lag_features(df, variable, lag_type=lag_type)
+            lag_features = self._cached_lag_features(df, variable, lag_type)
 
             if len(lag_features) == 0:
                 print(f"    ⚠ No {lag_type} lag features found for {variable}")
                 continue
 
-            # Calculate correlations for each lag period
-            row = {'variable': variable}
+            week_features = []
+
+            feature_by_week = {}
+            for feature in lag_features:
+                match = _WEEK_SUFFIX_RE.search(feature)
+                if match:
+                    feature_by_week.setdefault(int(match.group(1)), feature)
 
             for week in config.LAG_RANGE:
-                # Find the feature for this week with exact suffix matching
-                # Handle multiple naming conventions:
-                # - Standard: variable_lag_{week}, variable_lag_rolling{week}
-                # - NDVI: NDVImean_lag{week} (no underscore), NDVImean_lag_rollingmean{week}
-                if lag_type == 'simple':
-                    # Try both _lag_{week} and _lag{week} (NDVI style)
-                    possible_suffixes = [f'_lag_{week}', f'_lag{week}']
-                else:  # rolling
-                    # Try both _lag_rolling{week} and NDVI-specific rolling patterns
-                    possible_suffixes = [
-                        f'_lag_rolling{week}',
-                        f'_rolling{week}',
-                        f'_lag_rollingmean{week}',
-                        f'_lag_rollingmedian{week}',
-                        f'_lag_rollingsum{week}'
-                    ]
-
-                matching_features = [f for f in lag_features
-                                   if any(f.endswith(suffix) for suffix in possible_suffixes)]
-
-                if matching_features:
-                    feature = matching_features[0]
-
-                    # Calculate correlation
-                    valid_mask = df[[feature, target]].notna().all(axis=1)
-                    if valid_mask.sum() > 0:
-                        x = df.loc[valid_mask, feature]
-                        y = df.loc[valid_mask, target]
-                        corr, pval = stats.spearmanr(x, y)
-                        row[f'lag_{week}'] = corr
-                        row[f'lag_{week}_p'] = pval
-                    else:
-                        row[f'lag_{week}'] = np.nan
-                        row[f'lag_{week}_p'] = np.nan
+                if week in feature_by_week:
+                    week_features.append((week, feature_by_week[week]))
+
+            resolved.append((variable, week_features))
+
+        if not resolved:
+            return pd.DataFrame([])
+
+        # Preallocated (variables x lags) result arrays: correlations and
+        # p-values are written by position, skipping per-row dict
+        # allocations and DataFrame dtype inference
+        n_lags = len(config.LAG_RANGE)
+        week_col = {week: j for j, week in enumerate(config.LAG_RANGE)}
+        corr_arr = np.full((len(resolved), n_lags), np.nan)
+        n_pair_arr = np.full((len(resolved), n_lags), np.nan)
+
+        # One contiguous conversion for the target plus every needed lag
+        # column; per-variable blocks become integer-indexed slices of it
+        # instead of separate pandas selections. float32 halves the
+        # memory traffic of the block and its NaN masks; ranks and the
+        # correlation accumulation stay float64, so reported values are
+        # unchanged (rank order is what matters for Spearman)
+        needed = [target] + [feature for _, week_features in resolved
+                             for _, feature in week_features]
+        block = df[needed].to_numpy(dtype=np.float32)
+        col_idx = {name: i for i, name in enumerate(needed)}
+
+        # Rows with a missing target contribute to no pair, so all work
+        # happens on the target-valid subset of the block. The target's
+        # ranks are identical for every variable and lag week; computing
+        # them here removes the redundant re-ranking per variable
+        target_valid = ~np.isnan(block[:, 0])
+        valid_block = block[target_valid]
+        target_vals = valid_block[:, 0]
+        target_ranks = stats.rankdata(target_vals)
+
+        # Optional GPU path: with cuDF installed and enough rows to
+        # amortize the host-device transfer, the whole
+        # (target × features) Spearman matrix is computed on device in
+        # one call; the target column is already NaN-free here, so
+        # pairwise-complete sample sizes reduce to per-column counts.
+        # Any device-side failure falls back to the CPU paths below
+        gpu_done = False
+        if (_HAS_CUDF and
+                target_vals.size >= getattr(config, 'CUDF_MIN_ROWS', 10000)):
+            try:
+                corr_row = (cudf.DataFrame(valid_block)
+                            .corr(method='spearman')
+                            .to_pandas().to_numpy()[0, 1:])
+            except Exception as exc:
+                print(f"    ⚠ cuDF correlation failed ({exc}); "
+                      f"using CPU path")
+            else:
+                n_pairs_row = (~np.isnan(valid_block[:, 1:])).sum(axis=0)
+                for row_i, (_, week_features) in enumerate(resolved):
+                    if not week_features:
+                        continue
+                    # corr_row starts at the first feature column
+                    feat_cols = [col_idx[feature] - 1
+                                 for _, feature in week_features]
+                    out_cols = [week_col[week] for week, _ in week_features]
+                    corr_arr[row_i, out_cols] = corr_row[feat_cols]
+                    n_pair_arr[row_i, out_cols] = n_pairs_row[feat_cols]
+                gpu_done = True
+
+        # Partition variables by missingness, checked once over the whole
+        # block: NaN-free columns are batched into a single combined
+        # correlation call below; columns with NaNs go through the
+        # per-pair kernel path
+        clean_entries = []
+
+        if not gpu_done and target_vals.size > 0:
+            col_has_nan = np.isnan(valid_block).any(axis=0)
+            for row_i, (_, week_features) in enumerate(resolved):
+                if not week_features:
+                    continue
+                cols = [col_idx[feature] for _, feature in week_features]
+                if col_has_nan[cols].any():
+                    pending.append((row_i, week_features, valid_block[:, cols]))
                 else:
-                    row[f'lag_{week}'] = np.nan
-                    row[f'lag_{week}_p'] = np.nan
+                    clean_entries.append((row_i, week_features, cols))
+
+        # One rank + corrcoef call covers every clean variable at once
+        # (better cache locality and a single BLAS-backed matrix product
+        # instead of one small call per variable)
+        if clean_entries:
+            combined_cols = [col for _, _, cols in clean_entries
+                             for col in cols]
+            corrs, n_pairs = self._correlate_block(
+                target_vals, target_ranks, valid_block[:, combined_cols])
+
+            offset = 0
+            for row_i, week_features, cols in clean_entries:
+                out_cols = [week_col[week] for week, _ in week_features]
+                corr_arr[row_i, out_cols] = corrs[offset:offset + len(cols)]
+                n_pair_arr[row_i, out_cols] = n_pairs[offset:offset + len(cols)]
+                offset += len(cols)
+
+        # Variables are independent; the rank/correlation work runs in
+        # threads (NumPy and scipy release the GIL for the heavy parts)
+        if pending:
+            if _HAS_NUMBA:
+                # Warm the jitted kernel in the main thread (with the
+                # float32 signature actually dispatched): concurrent
+                # first-call compilation from worker threads is unsafe
+                _nan_spearman(np.zeros(3, dtype=np.float32),
+                              np.arange(3, dtype=np.float32))
+            outputs = Parallel(n_jobs=len(pending), prefer='threads')(
+                delayed(self._correlate_block)(target_vals, target_ranks,
+                                               feature_block)
+                for _, _, feature_block in pending
+            )
+
+            for (row_i, week_features, _), (corrs, n_pairs) in zip(pending, outputs):
+                cols = [week_col[week] for week, _ in week_features]
+                corr_arr[row_i, cols] = corrs
+                n_pair_arr[row_i, cols] = n_pairs
+
+        # p-values, when reported, are derived from the whole correlation
+        # matrix in one vectorized t-tail evaluation; cells that were
+        # never computed carry NaN correlations and stay NaN
+        report_pvalues = getattr(config, 'REPORT_PVALUES', True)
+        if report_pvalues:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t_stat = corr_arr * np.sqrt((n_pair_arr - 2) /
+                                            (1.0 - corr_arr ** 2))
+            pval_arr = 2.0 * stats.t.sf(np.abs(t_stat), n_pair_arr - 2)
+
+        # Assemble the result with the established interleaved column
+        # order (variable, lag_1, lag_1_p, lag_2, ...)
+        data = {'variable': [variable for variable, _ in resolved]}
+        for week, j in week_col.items():
+            data[f'lag_{week}'] = corr_arr[:, j]
+            if report_pvalues:
+                data[f'lag_{week}_p'] = pval_arr[:, j]
+
+        return pd.DataFrame(data)
+
+    @staticmethod
+    def _correlate_block(target_vals, target_ranks, feature_block):
+        """
+        Spearman correlations of each feature column against the target.
+
+        Parameters
+        ----------
+        target_vals : numpy.ndarray
+            Target values with missing entries already dropped
+        target_ranks : numpy.ndarray
+            Precomputed ranks of target_vals (shared across variables)
+        feature_block : numpy.ndarray
+            (n_samples, n_features) feature values aligned to target_vals
 
-            correlation_matrix.append(row)
+        Returns
+        -------
+        numpy.ndarray
+            Correlations per feature column
+        numpy.ndarray
+            Pairwise-complete sample sizes per feature column (p-values,
+            when enabled, are derived in bulk by the caller)
+        """
+        if np.isnan(feature_block).any():
+            # Per-pair missingness: the jitted kernel masks, ranks and
+            # correlates each column in one tight loop; without numba,
+            # pandas' Cython nancorr_spearman fastpath does the same
+            # pairwise-complete work (the target column is already
+            # NaN-free here, so pair validity = feature validity)
+            n_features = feature_block.shape[1]
+            if _HAS_NUMBA:
+                corrs = np.empty(n_features)
+                n_pairs = np.empty(n_features)
+                for j in range(n_features):
+                    corrs[j], n_pairs[j] = _nan_spearman(target_vals,
+                                                         feature_block[:, j])
+            else:
+                arr = np.empty((target_vals.size, 1 + n_features))
+                arr[:, 0] = target_vals
+                arr[:, 1:] = feature_block
+                corrs = pd.DataFrame(arr).corr(
+                    method='spearman').to_numpy()[0, 1:]
+                n_pairs = (~np.isnan(feature_block)).sum(axis=0)
+
+            return corrs, n_pairs
+
+        # Spearman = Pearson on ranks: the target's ranks are reused and
+        # only the feature columns are ranked here; one correlation matrix
+        # covers the block
+        ranks = np.empty((target_vals.size, 1 + feature_block.shape[1]))
+        ranks[:, 0] = target_ranks
+        ranks[:, 1:] = stats.rankdata(feature_block, axis=0)
+        corrs = np.corrcoef(ranks, rowvar=False)[0, 1:]
 
-        return pd.DataFrame(correlation_matrix)
+        return corrs, np.full(corrs.size, target_vals.size)
 
     def _find_optimal_lags(self, lag_simple_df, lag_rolling_df):
         """
@@ -203,51 +482,42 @@ class LagRollingAnalyzer(CityAnalyzer):
         pandas.DataFrame
             Optimal lags per variable
         """
-        optimal_lags = []
-
-        for _, row in lag_simple_df.iterrows():
-            variable = row['variable']
-
-            # Get correlations for all lag periods (simple)
-            lag_cols = [f'lag_{week}' for week in config.LAG_RANGE]
-            lag_corrs = pd.to_numeric(row[lag_cols], errors='coerce').values
-
-            # Find optimal lag (highest absolute correlation)
-            abs_corrs = np.abs(lag_corrs)
-            if not np.all(np.isnan(abs_corrs)):
-                optimal_idx = np.nanargmax(abs_corrs)
-                optimal_week = config.LAG_RANGE[optimal_idx]
-                optimal_corr = lag_corrs[optimal_idx]
-            else:
-                optimal_week = np.nan
-                optimal_corr = np.nan
-
-            # Get rolling optimal
-            rolling_row = lag_rolling_df[lag_rolling_df['variable'] == variable]
-            if len(rolling_row) > 0:
-                rolling_corrs = pd.to_numeric(rolling_row.iloc[0][lag_cols], errors='coerce').values
-                abs_rolling = np.abs(rolling_corrs)
-
-                if not np.all(np.isnan(abs_rolling)):
-                    optimal_rolling_idx = np.nanargmax(abs_rolling)
-                    optimal_rolling_week = config.LAG_RANGE[optimal_rolling_idx]
-                    optimal_rolling_corr = rolling_corrs[optimal_rolling_idx]
-                else:
-                    optimal_rolling_week = np.nan
-                    optimal_rolling_corr = np.nan
-            else:
-                optimal_rolling_week = np.nan
-                optimal_rolling_corr = np.nan
-
-            optimal_lags.append({
-                'variable': variable,
-                'optimal_lag_simple_weeks': optimal_week,
-                'optimal_lag_simple_correlation': optimal_corr,
-                'optimal_lag_rolling_weeks': optimal_rolling_week,
-                'optimal_lag_rolling_correlation': optimal_rolling_corr
-            })
+        if lag_simple_df.empty:
+            return pd.DataFrame([])
 
-        return pd.DataFrame(optimal_lags)
+        lag_cols = [f'lag_{week}' for week in config.LAG_RANGE]
+        lag_weeks = np.asarray(config.LAG_RANGE)
+
+        def find_optimal(matrix):
+            """Row-wise optimal week/correlation by highest |ρ|."""
+            abs_corrs = np.abs(matrix)
+            valid = ~np.all(np.isnan(abs_corrs), axis=1)
+            optimal_idx = np.where(np.isnan(abs_corrs), -np.inf,
+                                   abs_corrs).argmax(axis=1)
+            weeks = np.where(valid, lag_weeks[optimal_idx], np.nan)
+            corrs = np.where(valid,
+                             matrix[np.arange(len(matrix)), optimal_idx],
+                             np.nan)
+            return weeks, corrs
+
+        # Align rolling rows to the simple-lag variable order once instead
+        # of filtering lag_rolling_df per variable
+        variables = lag_simple_df['variable']
+        simple_matrix = lag_simple_df[lag_cols].to_numpy(dtype=np.float64)
+        rolling_matrix = (lag_rolling_df.set_index('variable')
+                          .reindex(variables)[lag_cols]
+                          .to_numpy(dtype=np.float64))
+
+        simple_weeks, simple_corrs = find_optimal(simple_matrix)
+        rolling_weeks, rolling_corrs = find_optimal(rolling_matrix)
+
+        return pd.DataFrame({
+            'variable': variables.to_numpy(),
+            'optimal_lag_simple_weeks': simple_weeks,
+            'optimal_lag_simple_correlation': simple_corrs,
+            'optimal_lag_rolling_weeks': rolling_weeks,
+            'optimal_lag_rolling_correlation': rolling_corrs
+        })
 
     def _create_lag_heatmap(self, lag_df, target, lag_type_name, city_name):
         """
@@ -269,36 +539,42 @@ class LagRollingAnalyzer(CityAnalyzer):
         matplotlib.figure.Figure
             Heatmap figure
         """
+        import matplotlib.pyplot as plt
+
         # Extract correlation values
+        # float32 is ample for a [-1, 1] range shown at two decimals
         lag_cols = [f'lag_{week}' for week in config.LAG_RANGE]
-        heatmap_data = lag_df[lag_cols].values
+        heatmap_data = lag_df[lag_cols].to_numpy(dtype=np.float32)
+        n_rows, n_cols = heatmap_data.shape
 
         # Create figure
         fig, ax = plt.subplots(figsize=(12, max(6, len(lag_df) * 0.5)))
 
-        # Create heatmap
-        sns.heatmap(
-            heatmap_data,
-            yticklabels=lag_df['variable'].values,
-            xticklabels=config.LAG_RANGE,
-            cmap=config.COLORMAP_DIVERGING,
-            center=0,
-            vmin=-1,
-            vmax=1,
-            annot=True,
-            fmt='.2f',
-            cbar_kws={'label': 'Spearman ρ'},
-            ax=ax
-        )
+        # Direct imshow + per-cell annotations: much cheaper than
+        # sns.heatmap(annot=True), which pays DataFrame-aware overhead
+        # per cell
+        im = ax.imshow(heatmap_data, cmap=config.COLORMAP_DIVERGING,
+                       vmin=-1, vmax=1, aspect='auto')
+        fig.colorbar(im, ax=ax, label='Spearman ρ')
+
+        for i in range(n_rows):
+            for j in range(n_cols):
+                value = heatmap_data[i, j]
+                if np.isnan(value):
+                    continue
+                ax.text(j, i, f'{value:.2f}', ha='center', va='center',
+                        fontsize=8)
+
+        ax.set_xticks(range(n_cols))
+        ax.set_xticklabels(config.LAG_RANGE, fontsize=config.FONT_SIZE_TICK)
+        ax.set_yticks(range(n_rows))
+        ax.set_yticklabels(lag_df['variable'], fontsize=config.FONT_SIZE_TICK)
 
         ax.set_title(f'{lag_type_name} Correlations with {target.upper()}\n{city_name}',
                     fontsize=config.FONT_SIZE_TITLE, fontweight='bold')
         ax.set_xlabel('Lag (weeks)', fontsize=config.FONT_SIZE_LABEL)
         ax.set_ylabel('Variable', fontsize=config.FONT_SIZE_LABEL)
 
-        plt.xticks(rotation=0, fontsize=config.FONT_SIZE_TICK)
-        plt.yticks(rotation=0, fontsize=config.FONT_SIZE_TICK)
-
         plt.tight_layout()
 
         return fig
@@ -323,6 +599,8 @@ class LagRollingAnalyzer(CityAnalyzer):
         matplotlib.figure.Figure
             Line plot figure
         """
+        import matplotlib.pyplot as plt
+
         n_vars = len(lag_simple_df)
         n_cols = 3
         n_rows = (n_vars + n_cols - 1) // n_cols
@@ -402,26 +680,22 @@ class LagRollingAnalyzer(CityAnalyzer):
             lines.append(f"\n### Optimal Lag Periods for {target.upper()}\n")
 
             optimal_df = self.results[f'{target}_optimal_lags']
-
-            lines.append(f"**Simple lag features:**\n")
-            for _, row in optimal_df.iterrows():
-                var = row['variable']
-                week = row['optimal_lag_simple_weeks']
-                corr = row['optimal_lag_simple_correlation']
-
-                if not np.isnan(week):
-                    lines.append(f"- {var}: {int(week)} weeks "
-                                f"(ρ = {corr:.3f})")
-
-            lines.append(f"\n**Rolling window features:**\n")
-            for _, row in optimal_df.iterrows():
-                var = row['variable']
-                week = row['optimal_lag_rolling_weeks']
-                corr = row['optimal_lag_rolling_correlation']
-
-                if not np.isnan(week):
-                    lines.append(f"- {var}: {int(week)} weeks "
-                                f"(ρ = {corr:.3f})")
+            variables = optimal_df['variable'].to_numpy()
+
+            # Iterate plain column arrays instead of iterrows(), which
+            # boxes every row as a Series
+            for header, kind in [('Simple lag features', 'simple'),
+                                 ('Rolling window features', 'rolling')]:
+                prefix = '' if kind == 'simple' else '\n'
+                lines.append(f"{prefix}**{header}:**\n")
+
+                weeks = optimal_df[f'optimal_lag_{kind}_weeks'].to_numpy()
+                corrs = optimal_df[f'optimal_lag_{kind}_correlation'].to_numpy()
+                lines.extend(
+                    f"- {var}: {int(week)} weeks (ρ = {corr:.3f})"
+                    for var, week, corr in zip(variables, weeks, corrs)
+                    if not np.isnan(week)
+                )
 
             # Summary
             simple_weeks = optimal_df['optimal_lag_simple_weeks'].dropna()
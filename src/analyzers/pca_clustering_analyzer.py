@@ -12,18 +12,38 @@ This module implements:
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # headless raster backend; no GUI event-loop overhead
 import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
+from scipy import linalg, stats
 from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
 from sklearn.cluster import KMeans
 from sklearn.metrics import silhouette_score, calinski_harabasz_score, davies_bouldin_score
 from sklearn.manifold import TSNE
 from scikit_posthocs import posthoc_dunn
+from joblib import Parallel, delayed
+# Threading policy for the k sweep: parallelism is applied at exactly one
+# level. When the sweep fans out across loky processes, each worker caps
+# its BLAS/OpenMP pools at 1 thread (oversubscription would thrash the
+# cores the sweep already occupies); when the warm-start ladder runs the
+# fits sequentially, the single fit gets the whole machine instead
+# (limits=os.cpu_count()), so elkan's distance GEMMs still use every core.
+from threadpoolctl import threadpool_limits
+import hashlib
+import joblib
 import os
 import sys
 
+# openTSNE is optional: its FFT-accelerated, multithreaded gradient
+# (FIt-SNE) is several times faster than sklearn's Barnes-Hut t-SNE on
+# large samples; sklearn remains the fallback when it is not installed
+try:
+    from openTSNE import TSNE as OpenTSNE
+    _HAS_OPENTSNE = True
+except ImportError:
+    _HAS_OPENTSNE = False
+
 # Add parent directories to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.base_analyzer import CityAnalyzer
@@ -32,6 +52,105 @@ from core.data_loader import DataLoader
 from config import analysis_config as config
 
 
+def _score_k(X_pca, k, kmeans, labels):
+    """
+    Compute the validation metrics for one fitted clustering.
+
+    Parameters
+    ----------
+    X_pca : numpy.ndarray
+        PCA-reduced data
+    k : int
+        Number of clusters
+    kmeans : sklearn.cluster.KMeans
+        Fitted estimator (for inertia_)
+    labels : numpy.ndarray
+        Cluster assignments
+
+    Returns
+    -------
+    dict
+        Metrics for this k (including labels and inertia)
+    """
+    # Calinski-Harabasz and Davies-Bouldin both reduce to the fitted
+    # centers plus one distance-to-centroid pass, so they are evaluated
+    # in closed form here instead of letting sklearn re-derive cluster
+    # means with a full O(n·k·d) scan each. Silhouette is the only
+    # genuinely expensive term and stays on the subsample recipe
+    n_samples = X_pca.shape[0]
+    centers = kmeans.cluster_centers_.astype(np.float64)
+    counts = np.bincount(labels, minlength=k).astype(np.float64)
+
+    residuals = X_pca - centers[labels]
+    sq_dist = np.einsum('ij,ij->i', residuals, residuals)
+
+    # Trace decomposition: tr(W) is the summed squared distance to the
+    # assigned centers, tr(B) the count-weighted center dispersion
+    # around the global mean
+    global_mean = (counts @ centers) / n_samples
+    center_dev = centers - global_mean
+    tr_w = sq_dist.sum()
+    tr_b = (counts * np.einsum('ij,ij->i', center_dev, center_dev)).sum()
+    calinski = (tr_b / (k - 1)) / (tr_w / (n_samples - k))
+
+    # Davies-Bouldin from per-cluster mean distances and the k×k
+    # center-distance matrix
+    scatter = np.bincount(labels, weights=np.sqrt(sq_dist),
+                          minlength=k) / counts
+    center_dists = np.sqrt(
+        ((centers[:, None, :] - centers[None, :, :]) ** 2).sum(axis=-1))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        similarity = (scatter[:, None] + scatter[None, :]) / center_dists
+    np.fill_diagonal(similarity, -np.inf)
+    davies = similarity.max(axis=1).mean()
+
+    return {
+        'k': k,
+        'silhouette': silhouette_score(
+            X_pca, labels,
+            sample_size=min(len(X_pca), config.SILHOUETTE_SAMPLE_SIZE),
+            random_state=config.RANDOM_SEED),
+        'calinski_harabasz': calinski,
+        'davies_bouldin': davies,
+        'labels': labels,
+        'inertia': kmeans.inertia_
+    }
+
+
+def _fit_eval_k(X_pca, k):
+    """
+    Fit K-means for one k and compute its validation metrics.
+
+    Module-level so the parallel k sweep can ship it to loky worker
+    processes without pickling the analyzer. Each worker pins its
+    BLAS/OpenMP pools to a single thread: the sweep itself already
+    occupies the cores, so inner-loop threading would only oversubscribe.
+
+    Parameters
+    ----------
+    X_pca : numpy.ndarray
+        PCA-reduced data
+    k : int
+        Number of clusters
+
+    Returns
+    -------
+    dict
+        Metrics for this k (including labels and inertia)
+    """
+    with threadpool_limits(limits=1):
+        kmeans = KMeans(
+            n_clusters=k,
+            n_init=config.KMEANS_N_INIT,
+            max_iter=config.KMEANS_MAX_ITER,
+            algorithm='elkan',
+            random_state=config.RANDOM_SEED
+        )
+        labels = kmeans.fit_predict(X_pca)
+
+        return _score_k(X_pca, k, kmeans, labels)
+
+
 class PCAClusteringAnalyzer(CityAnalyzer):
     """
     Analyzer for PCA dimensionality reduction and clustering analysis.
@@ -45,7 +164,7 @@ class PCAClusteringAnalyzer(CityAnalyzer):
         self.scaler = None
         self.pca = None
 
-    def analyze(self, df, city_key=None, **kwargs):
+    def analyze(self, df, city_key=None, use_cache=True, **kwargs):
         """
         Perform PCA and clustering analysis.
 
@@ -55,6 +174,10 @@ class PCAClusteringAnalyzer(CityAnalyzer):
             Input data with features and targets
         city_key : str, optional
             City identifier
+        use_cache : bool, default=True
+            Reuse the disk-cached scaler/PCA fit when the cleaned
+            feature matrix is unchanged (content-hash keyed, see
+            PCA_CACHE_DIR); the reduced matrix is memory-mapped on reuse
         **kwargs : dict
             Additional parameters
 
@@ -96,22 +219,65 @@ class PCAClusteringAnalyzer(CityAnalyzer):
         # Update results with clean sample size
         results['n_samples'] = len(df_clean)
 
-        # Extract feature values
-        X = df_clean[features].values
-
-        # Standardize
-        self.scaler = StandardScaler()
-        X_scaled = self.scaler.fit_transform(X)
-        print(f"  ✓ Standardized {X_scaled.shape[1]} features from {X_scaled.shape[0]:,} samples")
+        # Content-hash-keyed disk cache: re-running a city on unchanged
+        # data reuses the fitted scaler/PCA and memory-maps the reduced
+        # matrix instead of re-standardizing and refitting
+        cache_base = None
+        if use_cache:
+            os.makedirs(config.PCA_CACHE_DIR, exist_ok=True)
+            cache_base = os.path.join(
+                config.PCA_CACHE_DIR, self._pca_cache_key(df_clean[features]))
+
+        if cache_base is not None and os.path.exists(cache_base + '.joblib'):
+            print("  ✓ Features unchanged; reusing cached scaler/PCA fit")
+            cached = joblib.load(cache_base + '.joblib')
+            self.scaler = cached['scaler']
+            self.pca = cached['pca']
+            pca_results = cached['pca_results']
+            # Memory-mapping lets the OS page in only what the
+            # clustering sweep and t-SNE actually touch
+            pca_results['X_pca'] = np.load(cache_base + '.npy',
+                                           mmap_mode='r')
+
+            print("\nStep 2: Performing PCA...")
+            print(f"  ✓ {pca_results['n_components']} components explain "
+                  f"{pca_results['total_variance_explained']*100:.1f}% "
+                  f"variance (cached)")
+        else:
+            # Extract features as one contiguous float32 buffer and
+            # standardize it in place: halves the bytes moved through
+            # the scaler and the downstream covariance GEMM (sgemm
+            # instead of dgemm), with ample precision at this feature
+            # count
+            X = np.ascontiguousarray(
+                df_clean[features].to_numpy(dtype=np.float32))
+
+            # Standardize
+            self.scaler = StandardScaler(copy=False)
+            X_scaled = self.scaler.fit_transform(X)
+            print(f"  ✓ Standardized {X_scaled.shape[1]} features from {X_scaled.shape[0]:,} samples")
+
+            # Step 2: Perform PCA
+            print("\nStep 2: Performing PCA...")
+            pca_results = self._perform_pca(X_scaled)
+
+            if cache_base is not None:
+                np.save(cache_base + '.npy', pca_results['X_pca'])
+                joblib.dump(
+                    {'scaler': self.scaler, 'pca': self.pca,
+                     'pca_results': {key: value
+                                     for key, value in pca_results.items()
+                                     if key != 'X_pca'}},
+                    cache_base + '.joblib'
+                )
 
-        # Step 2: Perform PCA
-        print("\nStep 2: Performing PCA...")
-        pca_results = self._perform_pca(X_scaled)
         results.update(pca_results)
 
-        # Create scree plot
+        # Create scree plot, rendered to PNG bytes immediately so the
+        # live Figure is closed and dropped from pyplot's registry
+        # (keeps RSS bounded across multi-city runs)
         fig_scree = self._create_scree_plot(pca_results, city_name)
-        self.figures['scree_plot'] = fig_scree
+        self.figures['scree_plot'] = self._render_figure(fig_scree)
 
         # Step 3: Clustering on PCA-reduced data
         print("\nStep 3: K-means clustering with automatic k selection...")
@@ -131,14 +297,21 @@ class PCAClusteringAnalyzer(CityAnalyzer):
         print(f"  ✓ Optimal k = {optimal_k}")
         print(f"  ✓ Silhouette score: {clustering_results['optimal_silhouette']:.3f}")
 
+        # Factorize the cluster column once; the characteristics pass
+        # and the outcome tests both slice these cached positional
+        # indices instead of re-scanning the column
+        cluster_indices = df_clustered.groupby('cluster').indices
+
         # Step 4: Analyze cluster characteristics
         print("\nStep 4: Analyzing cluster characteristics...")
-        cluster_chars = self._analyze_cluster_characteristics(df_clustered, optimal_k)
+        cluster_chars = self._analyze_cluster_characteristics(
+            df_clustered, cluster_indices)
         results['cluster_characteristics'] = cluster_chars
 
         # Step 5: Test cluster-outcome relationships
         print("\nStep 5: Testing cluster-outcome relationships...")
-        outcome_tests = self._test_cluster_outcome_relationships(df_clustered, optimal_k)
+        outcome_tests = self._test_cluster_outcome_relationships(
+            df_clustered, cluster_indices)
         results.update(outcome_tests)
 
         # Step 6: Create visualizations
@@ -146,11 +319,12 @@ class PCAClusteringAnalyzer(CityAnalyzer):
 
         # t-SNE visualization
         fig_tsne = self._create_tsne_plot(X_pca, cluster_labels, optimal_k, city_name)
-        self.figures['tsne'] = fig_tsne
+        self.figures['tsne'] = self._render_figure(fig_tsne)
 
         # Cluster boxplots for POS/EGG
-        fig_boxplots = self._create_cluster_boxplots(df_clustered, optimal_k, city_name)
-        self.figures['cluster_boxplots'] = fig_boxplots
+        fig_boxplots = self._create_cluster_boxplots(
+            df_clustered, cluster_indices, city_name)
+        self.figures['cluster_boxplots'] = self._render_figure(fig_boxplots)
 
         # Store results
         self.results = results
@@ -161,6 +335,32 @@ class PCAClusteringAnalyzer(CityAnalyzer):
 
         return results
 
+    @staticmethod
+    def _pca_cache_key(feature_frame):
+        """
+        Content hash of the cleaned feature matrix and PCA settings.
+
+        The key changes with the data and with any config value that
+        affects the fit, so a stale cache entry can never be reused.
+
+        Parameters
+        ----------
+        feature_frame : pandas.DataFrame
+            Cleaned (NaN-free) feature columns
+
+        Returns
+        -------
+        str
+            Hex digest usable as a cache filename stem
+        """
+        digest = hashlib.md5()
+        digest.update(repr(list(feature_frame.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(feature_frame, index=False)
+                      .to_numpy().tobytes())
+        digest.update(repr(config.PCA_VARIANCE_TARGET).encode())
+        digest.update(repr(config.PCA_SCREE_COMPONENTS).encode())
+        return digest.hexdigest()
+
     def _perform_pca(self, X_scaled):
         """
         Perform PCA with variance optimization.
@@ -175,28 +375,77 @@ class PCAClusteringAnalyzer(CityAnalyzer):
         dict
             PCA results
         """
-        # Perform PCA retaining all components first
-        pca_full = PCA(random_state=config.RANDOM_SEED)
-        pca_full.fit(X_scaled)
-
-        # Find number of components for target variance
-        cumvar = np.cumsum(pca_full.explained_variance_ratio_)
+        # The data here is tall-thin (samples >> features), so one d×d
+        # covariance via a BLAS GEMM plus a symmetric eigendecomposition
+        # yields every eigenpair at once — replacing the previous
+        # all-components SVD fit followed by a truncated refit
+        mean = X_scaled.mean(axis=0)
+        Xc = X_scaled - mean
+        cov = (Xc.T @ Xc) / (Xc.shape[0] - 1)
+        n_features = cov.shape[0]
+
+        # Nothing downstream reads past the scree reach, so only the
+        # leading eigenpairs are requested (the eigh analogue of a
+        # truncated randomized SVD); the trace supplies the total
+        # variance without needing the rest of the spectrum. eigh
+        # returns ascending order — flip to descending and clamp tiny
+        # negative rounding noise on near-zero eigenvalues
+        total_variance = np.trace(cov)
+        n_top = min(n_features, config.PCA_SCREE_COMPONENTS)
+        eigvals, eigvecs = linalg.eigh(
+            cov, subset_by_index=(n_features - n_top, n_features - 1))
+        eigvals = np.clip(eigvals[::-1], 0.0, None)
+        eigvecs = eigvecs[:, ::-1]
+
+        all_ratio = eigvals / total_variance
+        cumvar = np.cumsum(all_ratio)
+
+        if cumvar[-1] < config.PCA_VARIANCE_TARGET and n_top < n_features:
+            # Truncated spectrum fell short of the variance target;
+            # redo with every eigenpair
+            eigvals, eigvecs = np.linalg.eigh(cov)
+            eigvals = np.clip(eigvals[::-1], 0.0, None)
+            eigvecs = eigvecs[:, ::-1]
+            all_ratio = eigvals / total_variance
+            cumvar = np.cumsum(all_ratio)
         n_components_target = np.argmax(cumvar >= config.PCA_VARIANCE_TARGET) + 1
 
         print(f"  ✓ {n_components_target} components explain "
               f"{cumvar[n_components_target-1]*100:.1f}% variance")
 
-        # Refit with optimal number of components
-        self.pca = PCA(n_components=n_components_target, random_state=config.RANDOM_SEED)
-        X_pca = self.pca.fit_transform(X_scaled)
+        # Deterministic sign convention (largest-|loading| entry
+        # positive), matching what a fixed-seed sklearn fit provides
+        components = eigvecs[:, :n_components_target]
+        signs = np.sign(components[np.abs(components).argmax(axis=0),
+                                   np.arange(n_components_target)])
+        signs[signs == 0] = 1.0
+        components = components * signs
+
+        # The reduced matrix is kept as contiguous float32: every
+        # downstream consumer (K-means sweep, validation metrics, t-SNE)
+        # is memory-bandwidth-bound and none needs double precision
+        X_pca = np.ascontiguousarray(Xc @ components, dtype=np.float32)
+
+        # Expose the fit through the sklearn PCA attribute names the
+        # rest of the pipeline (and any pickling of self.pca) relies on
+        self.pca = PCA(n_components=n_components_target)
+        self.pca.n_components_ = n_components_target
+        self.pca.components_ = components.T
+        self.pca.mean_ = mean
+        self.pca.explained_variance_ = eigvals[:n_components_target]
+        self.pca.explained_variance_ratio_ = all_ratio[:n_components_target]
+
+        # One cumsum serves everything below: the retained slice, the
+        # total at the cut-off, and the scree data
+        cumvar_selected = cumvar[:n_components_target]
 
         results = {
             'n_components': n_components_target,
             'explained_variance_ratio': self.pca.explained_variance_ratio_,
-            'cumulative_variance': np.cumsum(self.pca.explained_variance_ratio_),
-            'total_variance_explained': cumvar[n_components_target-1],
+            'cumulative_variance': cumvar_selected,
+            'total_variance_explained': cumvar_selected[-1],
             'X_pca': X_pca,
-            'all_explained_variance': pca_full.explained_variance_ratio_[:config.PCA_SCREE_COMPONENTS]
+            'all_explained_variance': all_ratio[:config.PCA_SCREE_COMPONENTS]
         }
 
         return results
@@ -215,32 +464,25 @@ class PCAClusteringAnalyzer(CityAnalyzer):
         dict
             Clustering results with optimal k
         """
-        metrics_results = []
-
-        for k in config.CLUSTERING_K_RANGE:
-            kmeans = KMeans(
-                n_clusters=k,
-                n_init=config.KMEANS_N_INIT,
-                max_iter=config.KMEANS_MAX_ITER,
-                random_state=config.RANDOM_SEED
+        if getattr(config, 'KMEANS_WARM_START', True):
+            # Centroid-splitting ladder: only the smallest k pays the
+            # full n_init restarts, each larger k runs a single Lloyd
+            # pass from the previous solution
+            metrics_results = self._warm_start_sweep(X_pca)
+        else:
+            # Each k is an independent fit + score, so the sweep fans
+            # out across cores as separate processes (one k per task);
+            # results are deterministic per k via random_state and
+            # arrive in order
+            metrics_results = Parallel(n_jobs=-1, backend='loky',
+                                       batch_size=1)(
+                delayed(_fit_eval_k)(X_pca, k)
+                for k in config.CLUSTERING_K_RANGE
             )
-            labels = kmeans.fit_predict(X_pca)
-
-            # Calculate metrics
-            silhouette = silhouette_score(X_pca, labels)
-            calinski = calinski_harabasz_score(X_pca, labels)
-            davies = davies_bouldin_score(X_pca, labels)
 
-            metrics_results.append({
-                'k': k,
-                'silhouette': silhouette,
-                'calinski_harabasz': calinski,
-                'davies_bouldin': davies,
-                'labels': labels,
-                'inertia': kmeans.inertia_
-            })
-
-            print(f"    k={k}: Silhouette={silhouette:.3f}, CH={calinski:.1f}, DB={davies:.3f}")
+        for m in metrics_results:
+            print(f"    k={m['k']}: Silhouette={m['silhouette']:.3f}, "
+                  f"CH={m['calinski_harabasz']:.1f}, DB={m['davies_bouldin']:.3f}")
 
         # Select optimal k based on silhouette score (higher is better)
         metrics_df = pd.DataFrame(metrics_results)
@@ -259,7 +501,70 @@ class PCAClusteringAnalyzer(CityAnalyzer):
 
         return results
 
-    def _analyze_cluster_characteristics(self, df_clustered, optimal_k):
+    def _warm_start_sweep(self, X_pca):
+        """
+        Sweep k by warm-starting each fit from the previous solution.
+
+        The smallest k is fitted with the full KMEANS_N_INIT restarts;
+        every subsequent k is initialized with the previous centers plus
+        the point farthest from its assigned center (furthest-first
+        split) and refined with a single Lloyd run. This cuts the total
+        number of initializations by roughly a factor of KMEANS_N_INIT
+        at a minor metric cost; set config.KMEANS_WARM_START = False to
+        fall back to independent fits per k.
+
+        Parameters
+        ----------
+        X_pca : numpy.ndarray
+            PCA-reduced data
+
+        Returns
+        -------
+        list of dict
+            Metrics per k, in CLUSTERING_K_RANGE order
+        """
+        metrics_results = []
+        prev_centers = None
+        prev_labels = None
+
+        # Sequential sweep: let each fit use every core (see the
+        # threading-policy note next to the threadpoolctl import)
+        with threadpool_limits(limits=os.cpu_count()):
+            for k in config.CLUSTERING_K_RANGE:
+                if prev_centers is None or k != prev_centers.shape[0] + 1:
+                    kmeans = KMeans(
+                        n_clusters=k,
+                        n_init=config.KMEANS_N_INIT,
+                        max_iter=config.KMEANS_MAX_ITER,
+                        algorithm='elkan',
+                        random_state=config.RANDOM_SEED
+                    )
+                else:
+                    # Split: add the point with the largest distance to
+                    # its assigned center as the (k+1)-th seed
+                    residuals = X_pca - prev_centers[prev_labels]
+                    farthest = np.einsum('ij,ij->i', residuals,
+                                         residuals).argmax()
+                    init_centers = np.vstack([prev_centers,
+                                              X_pca[farthest]])
+                    kmeans = KMeans(
+                        n_clusters=k,
+                        init=init_centers,
+                        n_init=1,
+                        max_iter=config.KMEANS_MAX_ITER,
+                        algorithm='elkan',
+                        random_state=config.RANDOM_SEED
+                    )
+
+                labels = kmeans.fit_predict(X_pca)
+                metrics_results.append(_score_k(X_pca, k, kmeans, labels))
+
+                prev_centers = kmeans.cluster_centers_
+                prev_labels = labels
+
+        return metrics_results
+
+    def _analyze_cluster_characteristics(self, df_clustered, cluster_indices):
         """
         Analyze characteristics of each cluster.
 
@@ -267,39 +572,59 @@ class PCAClusteringAnalyzer(CityAnalyzer):
         ----------
         df_clustered : pandas.DataFrame
             Data with cluster assignments
-        optimal_k : int
-            Number of clusters
+        cluster_indices : dict
+            Positional row indices per cluster id, from the shared
+            groupby built in analyze()
 
         Returns
         -------
         pandas.DataFrame
             Cluster characteristics
         """
-        char_list = []
+        # Pure-NumPy aggregation over the cached indices: per-cluster
+        # sums via bincount yield means and (ddof=1) stds in O(n)
+        # without pandas' per-call block-manager dispatch; medians come
+        # from the per-cluster slices. NaNs are masked out per target
+        cluster_ids = sorted(cluster_indices)
+        k = len(cluster_ids)
+
+        labels = np.empty(len(df_clustered), dtype=np.intp)
+        for pos, cluster_id in enumerate(cluster_ids):
+            labels[cluster_indices[cluster_id]] = pos
+
+        data = {
+            'cluster': cluster_ids,
+            'n_samples': [len(cluster_indices[cid]) for cid in cluster_ids]
+        }
 
-        for cluster_id in range(optimal_k):
-            cluster_data = df_clustered[df_clustered['cluster'] == cluster_id]
+        for target in config.TARGETS:
+            if target not in df_clustered.columns:
+                continue
 
-            char = {
-                'cluster': cluster_id,
-                'n_samples': len(cluster_data)
-            }
+            values = df_clustered[target].to_numpy(dtype=np.float64)
+            valid = ~np.isnan(values)
+            filled = np.where(valid, values, 0.0)
 
-            # Statistics for each target
-            for target in config.TARGETS:
-                if target in cluster_data.columns:
-                    target_data = cluster_data[target].dropna()
-                    char[f'{target}_mean'] = target_data.mean()
-                    char[f'{target}_std'] = target_data.std()
-                    char[f'{target}_median'] = target_data.median()
+            counts = np.bincount(labels, weights=valid, minlength=k)
+            sums = np.bincount(labels, weights=filled, minlength=k)
+            sq_sums = np.bincount(labels, weights=filled * filled,
+                                  minlength=k)
 
-            char_list.append(char)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                means = sums / counts
+                variances = (sq_sums - counts * means ** 2) / (counts - 1)
 
-        char_df = pd.DataFrame(char_list)
+            data[f'{target}_mean'] = means
+            data[f'{target}_std'] = np.sqrt(np.clip(variances, 0.0, None))
+            data[f'{target}_median'] = [
+                np.median(values[idx][valid[idx]])
+                if valid[idx].any() else np.nan
+                for idx in (cluster_indices[cid] for cid in cluster_ids)
+            ]
 
-        return char_df
+        return pd.DataFrame(data)
 
-    def _test_cluster_outcome_relationships(self, df_clustered, optimal_k):
+    def _test_cluster_outcome_relationships(self, df_clustered, cluster_indices):
         """
         Test relationships between clusters and outcomes using Kruskal-Wallis and Dunn's tests.
 
@@ -307,8 +632,9 @@ class PCAClusteringAnalyzer(CityAnalyzer):
         ----------
         df_clustered : pandas.DataFrame
             Data with cluster assignments
-        optimal_k : int
-            Number of clusters
+        cluster_indices : dict
+            Positional row indices per cluster id, from the shared
+            groupby built in analyze()
 
         Returns
         -------
@@ -316,14 +642,27 @@ class PCAClusteringAnalyzer(CityAnalyzer):
             Test results
         """
         results = {}
+        cluster_ids = sorted(cluster_indices)
 
         for target in config.TARGETS:
             if target not in df_clustered.columns:
                 continue
 
-            # Prepare data for testing
-            groups = [df_clustered[df_clustered['cluster'] == i][target].dropna()
-                     for i in range(optimal_k)]
+            # Slice the cached positional indices instead of re-running
+            # dropna + groupby per target, masking NaNs per cluster.
+            # The valid values are mid-ranked a single time: both
+            # Kruskal-Wallis and Dunn's test are rank-based and
+            # invariant under this transform (tie structure included),
+            # so neither needs to touch the raw column again
+            values = df_clustered[target].to_numpy(dtype=np.float64)
+            raw_groups = []
+            for cluster_id in cluster_ids:
+                group_values = values[cluster_indices[cluster_id]]
+                raw_groups.append(group_values[~np.isnan(group_values)])
+
+            all_ranks = stats.rankdata(np.concatenate(raw_groups))
+            lengths = [len(g) for g in raw_groups]
+            groups = np.split(all_ranks, np.cumsum(lengths)[:-1])
 
             # Kruskal-Wallis H-test
             h_stat, p_value = stats.kruskal(*groups)
@@ -335,12 +674,13 @@ class PCAClusteringAnalyzer(CityAnalyzer):
 
             # If significant, perform Dunn's post-hoc test
             if p_value < 0.05:
-                # Prepare data for Dunn's test
-                df_test = df_clustered[['cluster', target]].dropna()
-
+                df_test = pd.DataFrame({
+                    'cluster': np.repeat(cluster_ids, lengths),
+                    '_rank': all_ranks
+                })
                 dunn_result = posthoc_dunn(
                     df_test,
-                    val_col=target,
+                    val_col='_rank',
                     group_col='cluster',
                     p_adjust='bonferroni'
                 )
@@ -423,22 +763,47 @@ class PCAClusteringAnalyzer(CityAnalyzer):
         # Sample data if too large
         if len(X_pca) > config.TSNE_SAMPLE_SIZE:
             print(f"  ✓ Sampling {config.TSNE_SAMPLE_SIZE} points for t-SNE...")
-            indices = np.random.choice(len(X_pca), config.TSNE_SAMPLE_SIZE, replace=False)
+            # shuffle=False samples without replacement in
+            # O(sample_size) instead of permuting all n rows, and the
+            # seeded generator makes the subsample reproducible
+            rng = np.random.default_rng(config.RANDOM_SEED)
+            indices = rng.choice(len(X_pca), size=config.TSNE_SAMPLE_SIZE,
+                                 replace=False, shuffle=False)
             X_sample = X_pca[indices]
             labels_sample = labels[indices]
         else:
             X_sample = X_pca
             labels_sample = labels
 
+        # The gradient/affinity kernels are memory-bound and work in
+        # single precision internally; a contiguous float32 buffer
+        # avoids an internal cast-and-copy (no-op when X_pca is already
+        # float32, but callers are not required to guarantee that)
+        X_sample = np.ascontiguousarray(X_sample, dtype=np.float32)
+
         # Perform t-SNE
         print(f"  ✓ Computing t-SNE...")
-        tsne = TSNE(
-            n_components=2,
-            perplexity=config.TSNE_PERPLEXITY,
-            max_iter=config.TSNE_MAX_ITER,
-            random_state=config.RANDOM_SEED
-        )
-        X_tsne = tsne.fit_transform(X_sample)
+        if _HAS_OPENTSNE:
+            # FFT gradient + PCA initialization: faster convergence and
+            # a deterministic layout across runs
+            tsne = OpenTSNE(
+                n_components=2,
+                perplexity=config.TSNE_PERPLEXITY,
+                n_iter=config.TSNE_MAX_ITER,
+                negative_gradient_method='fft',
+                initialization='pca',
+                n_jobs=-1,
+                random_state=config.RANDOM_SEED
+            )
+            X_tsne = np.asarray(tsne.fit(X_sample))
+        else:
+            tsne = TSNE(
+                n_components=2,
+                perplexity=config.TSNE_PERPLEXITY,
+                max_iter=config.TSNE_MAX_ITER,
+                random_state=config.RANDOM_SEED
+            )
+            X_tsne = tsne.fit_transform(X_sample)
 
         # Create plot
         fig, ax = plt.subplots(figsize=(10, 8))
@@ -465,7 +830,7 @@ class PCAClusteringAnalyzer(CityAnalyzer):
 
         return fig
 
-    def _create_cluster_boxplots(self, df_clustered, optimal_k, city_name):
+    def _create_cluster_boxplots(self, df_clustered, cluster_indices, city_name):
         """
         Create boxplots showing POS and EGG distributions by cluster.
 
@@ -473,8 +838,9 @@ class PCAClusteringAnalyzer(CityAnalyzer):
         ----------
         df_clustered : pandas.DataFrame
             Data with cluster assignments
-        optimal_k : int
-            Number of clusters
+        cluster_indices : dict
+            Positional row indices per cluster id, from the shared
+            groupby built in analyze()
         city_name : str
             City name
 
@@ -485,22 +851,48 @@ class PCAClusteringAnalyzer(CityAnalyzer):
         """
         fig, axes = plt.subplots(1, 2, figsize=(12, 5))
 
+        cluster_ids = sorted(cluster_indices)
+        palette = plt.get_cmap(config.COLORMAP_CATEGORICAL)
+        rng = np.random.default_rng(config.RANDOM_SEED)
+
         for idx, target in enumerate(config.TARGETS):
             if target not in df_clustered.columns:
                 continue
 
             ax = axes[idx]
-
-            # Create boxplot
-            df_plot = df_clustered[['cluster', target]].dropna()
-
-            sns.boxplot(
-                data=df_plot,
-                x='cluster',
-                y=target,
-                ax=ax,
-                palette=config.COLORMAP_CATEGORICAL
-            )
+            values = df_clustered[target].to_numpy(dtype=np.float64)
+
+            # Boxes only need the quantiles, so the stats are computed
+            # here and handed to ax.bxp directly: this skips seaborn's
+            # per-point drawing path, and outliers are capped at a
+            # seeded sample per cluster instead of rasterizing every
+            # point on large cities
+            box_stats = []
+            for cluster_id in cluster_ids:
+                v = values[cluster_indices[cluster_id]]
+                v = v[~np.isnan(v)]
+
+                q1, med, q3 = np.percentile(v, [25, 50, 75])
+                lo_limit = q1 - 1.5 * (q3 - q1)
+                hi_limit = q3 + 1.5 * (q3 - q1)
+                inliers = v[(v >= lo_limit) & (v <= hi_limit)]
+                fliers = v[(v < lo_limit) | (v > hi_limit)]
+                if fliers.size > 500:
+                    fliers = rng.choice(fliers, size=500, replace=False)
+
+                box_stats.append({
+                    'label': str(cluster_id),
+                    'med': med,
+                    'q1': q1,
+                    'q3': q3,
+                    'whislo': inliers.min() if inliers.size else q1,
+                    'whishi': inliers.max() if inliers.size else q3,
+                    'fliers': fliers
+                })
+
+            artists = ax.bxp(box_stats, patch_artist=True)
+            for patch, cluster_id in zip(artists['boxes'], cluster_ids):
+                patch.set_facecolor(palette(cluster_id % palette.N))
 
             ax.set_xlabel('Cluster', fontsize=config.FONT_SIZE_LABEL)
             ax.set_ylabel(target.upper(), fontsize=config.FONT_SIZE_LABEL)
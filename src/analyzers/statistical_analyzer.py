@@ -12,15 +12,18 @@ This module implements comprehensive statistical analysis including:
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # headless raster backend; no GUI event-loop overhead
 import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
+from matplotlib.figure import Figure
+import hashlib
 import os
 import sys
 
 # Add parent directories to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from core.base_analyzer import CityAnalyzer, calculate_correlation, bonferroni_correction
+from core.base_analyzer import (CityAnalyzer, calculate_correlations_multi,
+                                bonferroni_correction)
 from core.academic_writer import AcademicWriter
 from core.data_loader import DataLoader
 from config import analysis_config as config
@@ -36,8 +39,9 @@ class StatisticalAnalyzer(CityAnalyzer):
         super().__init__(name='statistical')
         self.writer = AcademicWriter()
         self.loader = DataLoader()
+        self._heatmap_fig = None  # pooled figure, reused across targets
 
-    def analyze(self, df, city_key=None, **kwargs):
+    def analyze(self, df, city_key=None, use_cache=True, **kwargs):
         """
         Perform statistical correlation analysis.
 
@@ -47,6 +51,9 @@ class StatisticalAnalyzer(CityAnalyzer):
             Input data with features and targets
         city_key : str, optional
             City identifier
+        use_cache : bool, default=True
+            Reuse the on-disk Parquet correlation table when the input
+            columns are unchanged (content-hash keyed)
         **kwargs : dict
             Additional parameters
 
@@ -77,6 +84,63 @@ class StatisticalAnalyzer(CityAnalyzer):
         # Initialize corrected_alpha before loop
         corrected_alpha = None
 
+        # Bind per-target settings once instead of re-reading config
+        # module attributes on every loop iteration
+        bonferroni_alpha = config.BONFERRONI_ALPHA
+        n_top = config.N_TOP_CORRELATIONS
+        n_heatmap = config.N_HEATMAP_FEATURES
+
+        # Positional indices of each feature group within the feature
+        # list, computed once and reused for every target (replaces
+        # repeated hash-based isin scans over the full Series)
+        feature_pos = {f: i for i, f in enumerate(features)}
+        group_indices = {
+            group_name: np.sort(np.array(
+                [feature_pos[f] for f in group_feats if f in feature_pos],
+                dtype=np.intp))
+            for group_name, group_feats in feature_groups.items()
+        }
+
+        targets_present = [t for t in config.TARGETS if t in df.columns]
+
+        # Correlation tables are cheap to store and expensive to rebuild
+        # on re-runs, so they are cached as Parquet keyed by a content
+        # hash of the exact input columns
+        cache_path = None
+        if use_cache:
+            cache_path = os.path.join(
+                config.STATS_CACHE_DIR,
+                'spearman_' + self._correlation_cache_key(
+                    df, features, targets_present) + '.parquet')
+
+        # Rank features once and correlate against both targets together:
+        # the rank matrix is shared, so the second target costs only one
+        # extra ranked column instead of a full re-ranking pass
+        if cache_path is not None and os.path.exists(cache_path):
+            cached = pd.read_parquet(cache_path)
+            correlations_by_target = {
+                t: (cached[f'correlation_{t}'].rename(None),
+                    cached[f'p_value_{t}'].rename(None))
+                for t in targets_present
+            }
+            print("✓ Loaded correlations from cache")
+        else:
+            correlations_by_target = calculate_correlations_multi(
+                df, features, targets_present,
+                method=config.CORRELATION_METHOD
+            )
+            if cache_path is not None:
+                try:
+                    os.makedirs(config.STATS_CACHE_DIR, exist_ok=True)
+                    cache_df = pd.DataFrame(index=pd.Index(features))
+                    for t in targets_present:
+                        corr_t, pval_t = correlations_by_target[t]
+                        cache_df[f'correlation_{t}'] = corr_t
+                        cache_df[f'p_value_{t}'] = pval_t
+                    cache_df.to_parquet(cache_path, compression='zstd')
+                except Exception as exc:  # cache failures are non-fatal
+                    print(f"⚠ Could not write correlation cache ({exc})")
+
         # Analyze each target
         for target in config.TARGETS:
             if target not in df.columns:
@@ -85,14 +149,11 @@ class StatisticalAnalyzer(CityAnalyzer):
 
             print(f"\nAnalyzing correlations with {target.upper()}...")
 
-            # Calculate correlations
-            correlations, p_values = calculate_correlation(
-                df, features, target, method=config.CORRELATION_METHOD
-            )
+            correlations, p_values = correlations_by_target[target]
 
             # Bonferroni correction
             corrected_alpha, significant = bonferroni_correction(
-                p_values, alpha=config.BONFERRONI_ALPHA
+                p_values, alpha=bonferroni_alpha
             )
 
             n_significant = significant.sum()
@@ -108,7 +169,7 @@ class StatisticalAnalyzer(CityAnalyzer):
             # Get top correlations
             top_pos, top_neg = self._get_top_correlations(
                 correlations, p_values,
-                n_top=config.N_TOP_CORRELATIONS
+                n_top=n_top
             )
 
             results[f'{target}_top_positive'] = top_pos
@@ -128,7 +189,7 @@ class StatisticalAnalyzer(CityAnalyzer):
 
             # Group correlations by feature type
             grouped_corr = self._group_correlations_by_type(
-                correlations, p_values, feature_groups
+                correlations, p_values, group_indices
             )
             results[f'{target}_grouped_correlations'] = grouped_corr
 
@@ -137,9 +198,12 @@ class StatisticalAnalyzer(CityAnalyzer):
                 correlations, p_values,
                 target=target,
                 city_name=city_name,
-                n_features=config.N_HEATMAP_FEATURES
+                n_features=n_heatmap
             )
-            self.figures[f'{target}_heatmap'] = fig
+            # Rasterize once; the pooled figure is cleared on next use
+            # rather than closed
+            self.figures[f'{target}_heatmap'] = self._render_figure(
+                fig, close=False)
 
         # Store results
         self.results = results
@@ -153,6 +217,36 @@ class StatisticalAnalyzer(CityAnalyzer):
 
         return results
 
+    @staticmethod
+    def _correlation_cache_key(df, features, targets):
+        """
+        Content hash of the correlation inputs and settings.
+
+        The key changes with the data, the feature/target columns and
+        the correlation method, so a stale entry can never be reused.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Input data
+        features : list
+            Feature column names
+        targets : list
+            Target column names
+
+        Returns
+        -------
+        str
+            Hex digest usable as a cache filename stem
+        """
+        digest = hashlib.md5()
+        digest.update(repr(list(features)).encode())
+        digest.update(repr(list(targets)).encode())
+        digest.update(repr(config.CORRELATION_METHOD).encode())
+        digest.update(pd.util.hash_pandas_object(
+            df[features + targets], index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
     def _get_top_correlations(self, correlations, p_values, n_top=20):
         """
         Get top positive and negative correlations.
@@ -173,30 +267,32 @@ class StatisticalAnalyzer(CityAnalyzer):
         pandas.DataFrame
             Top negative correlations
         """
-        # Combine into dataframe
-        df = pd.DataFrame({
-            'feature': correlations.index,
-            'correlation': correlations.values,
-            'p_value': p_values.values,
-            'abs_correlation': np.abs(correlations.values)
-        })
-
-        # Remove NaN correlations
-        df = df.dropna()
-
-        # Top positive
-        top_positive = df[df['correlation'] > 0].sort_values(
-            'correlation', ascending=False
-        ).head(n_top)
-
-        # Top negative
-        top_negative = df[df['correlation'] < 0].sort_values(
-            'correlation', ascending=True
-        ).head(n_top)
+        # Work on the raw arrays and only materialize the <= n_top rows
+        # that survive, instead of building and sorting an N-row frame
+        corr = correlations.to_numpy()
+        pval = p_values.to_numpy()
+        feats = correlations.index.to_numpy()
+
+        valid = ~(np.isnan(corr) | np.isnan(pval))
+
+        def _top_slice(side_mask, descending):
+            idx = np.flatnonzero(valid & side_mask)
+            order = np.argsort(-corr[idx] if descending else corr[idx],
+                               kind='stable')[:n_top]
+            sel = idx[order]
+            return pd.DataFrame({
+                'feature': feats[sel],
+                'correlation': corr[sel],
+                'p_value': pval[sel],
+                'abs_correlation': np.abs(corr[sel])
+            })
+
+        top_positive = _top_slice(corr > 0, descending=True)
+        top_negative = _top_slice(corr < 0, descending=False)
 
         return top_positive, top_negative
 
-    def _group_correlations_by_type(self, correlations, p_values, feature_groups):
+    def _group_correlations_by_type(self, correlations, p_values, group_indices):
         """
         Group correlations by feature type (temperature, rainfall, NDVI, demographic).
 
@@ -206,8 +302,9 @@ class StatisticalAnalyzer(CityAnalyzer):
             Correlations
         p_values : pandas.Series
             P-values
-        feature_groups : dict
-            Dictionary of {group_name: [feature_names]}
+        group_indices : dict
+            Precomputed positional indices per group
+            ({group_name: ndarray of positions in the feature axis})
 
         Returns
         -------
@@ -216,16 +313,12 @@ class StatisticalAnalyzer(CityAnalyzer):
         """
         grouped = {}
 
-        for group_name, features in feature_groups.items():
-            # Get correlations for this group
-            group_corr = correlations[correlations.index.isin(features)]
-            group_p = p_values[p_values.index.isin(features)]
-
-            # Create dataframe
+        for group_name, idx in group_indices.items():
+            # O(|group|) positional slices instead of full-Series isin
             group_df = pd.DataFrame({
-                'feature': group_corr.index,
-                'correlation': group_corr.values,
-                'p_value': group_p.values
+                'feature': correlations.index.take(idx),
+                'correlation': correlations.values[idx],
+                'p_value': p_values.values[idx]
             })
 
             # Sort by absolute correlation
@@ -258,30 +351,51 @@ class StatisticalAnalyzer(CityAnalyzer):
         matplotlib.figure.Figure
             Heatmap figure
         """
-        # Get top features by absolute correlation
-        abs_corr = correlations.abs().sort_values(ascending=False).head(n_features)
-        top_features = abs_corr.index.tolist()
+        # Get top features by absolute correlation: O(N) argpartition to
+        # pick the k strongest, then sort just those k for display order
+        abs_vals = np.abs(correlations.to_numpy())
+        k = min(n_features, len(abs_vals))
+        if k < len(abs_vals):
+            top_idx = np.sort(np.argpartition(-abs_vals, k - 1)[:k])
+            top_idx = top_idx[np.argsort(-abs_vals[top_idx], kind='stable')]
+        else:
+            top_idx = np.argsort(-abs_vals, kind='stable')
+        top_features = correlations.index.take(top_idx).tolist()
 
         # Create data for heatmap (single column)
         heatmap_data = correlations[top_features].values.reshape(-1, 1)
 
-        # Create figure
-        fig, ax = plt.subplots(figsize=(6, max(8, n_features * 0.3)))
-
-        # Create heatmap
-        sns.heatmap(
-            heatmap_data,
-            yticklabels=top_features,
-            xticklabels=[target.upper()],
-            cmap=config.COLORMAP_DIVERGING,
-            center=0,
-            vmin=-1,
-            vmax=1,
-            annot=True,
-            fmt='.3f',
-            cbar_kws={'label': 'Spearman ρ'},
-            ax=ax
-        )
+        # Reuse one pooled figure across targets and cities instead of
+        # allocating renderer state per call; it lives outside pyplot's
+        # registry, and constrained layout replaces the old per-figure
+        # tight_layout pass
+        if self._heatmap_fig is None:
+            self._heatmap_fig = Figure(
+                figsize=(6, max(8, n_features * 0.3)), layout='constrained')
+        fig = self._heatmap_fig
+        fig.clear()
+        fig.set_size_inches(6, max(8, n_features * 0.3))
+        ax = fig.add_subplot(111)
+
+        # Draw directly with imshow instead of seaborn's heatmap, which
+        # coerces through a DataFrame and lays out one text artist per
+        # cell inside its own loop
+        cmap = plt.get_cmap(config.COLORMAP_DIVERGING)
+        im = ax.imshow(heatmap_data, cmap=cmap, vmin=-1, vmax=1,
+                       aspect='auto')
+        fig.colorbar(im, ax=ax, label='Spearman ρ')
+
+        # Annotate each cell, flipping to white text on dark extremes
+        for i, value in enumerate(heatmap_data[:, 0]):
+            r, g, b, _ = cmap((value + 1) / 2)
+            luminance = 0.299 * r + 0.587 * g + 0.114 * b
+            ax.text(0, i, f'{value:.3f}', ha='center', va='center',
+                    color='white' if luminance < 0.5 else 'black')
+
+        ax.set_xticks([0])
+        ax.set_xticklabels([target.upper()])
+        ax.set_yticks(np.arange(len(top_features)))
+        ax.set_yticklabels(top_features)
 
         # Format
         ax.set_title(f'Top {n_features} Feature Correlations with {target.upper()}\n{city_name}',
@@ -289,11 +403,10 @@ class StatisticalAnalyzer(CityAnalyzer):
         ax.set_xlabel('Target Variable', fontsize=config.FONT_SIZE_LABEL)
         ax.set_ylabel('Features', fontsize=config.FONT_SIZE_LABEL)
 
-        # Rotate labels
-        plt.xticks(rotation=0, fontsize=config.FONT_SIZE_TICK)
-        plt.yticks(rotation=0, fontsize=config.FONT_SIZE_TICK)
-
-        plt.tight_layout()
+        # Tick styling on the axes object (not pyplot's current-axes
+        # state, which points at the colorbar after fig.colorbar)
+        ax.tick_params(axis='both', rotation=0,
+                       labelsize=config.FONT_SIZE_TICK)
 
         return fig
 
@@ -362,18 +475,20 @@ class StatisticalAnalyzer(CityAnalyzer):
             if len(top_pos) > 0:
                 lines.append(f"\n**Strongest positive correlations:**\n")
 
-                for i, row in top_pos.head(5).iterrows():
-                    corr_str = self.writer.format_correlation(row['correlation'], row['p_value'])
-                    lines.append(f"- {row['feature']}: {corr_str}")
+                for feature, correlation, p_value, *_ in top_pos.head(5).itertuples(
+                        index=False, name=None):
+                    corr_str = self.writer.format_correlation(correlation, p_value)
+                    lines.append(f"- {feature}: {corr_str}")
 
             # Top negative correlations
             top_neg = self.results[f'{target}_top_negative']
             if len(top_neg) > 0:
                 lines.append(f"\n**Strongest negative correlations:**\n")
 
-                for i, row in top_neg.head(5).iterrows():
-                    corr_str = self.writer.format_correlation(row['correlation'], row['p_value'])
-                    lines.append(f"- {row['feature']}: {corr_str}")
+                for feature, correlation, p_value, *_ in top_neg.head(5).itertuples(
+                        index=False, name=None):
+                    corr_str = self.writer.format_correlation(correlation, p_value)
+                    lines.append(f"- {feature}: {corr_str}")
 
             # Feature group summary
             grouped = self.results[f'{target}_grouped_correlations']
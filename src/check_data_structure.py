@@ -61,9 +61,20 @@ def check_file_structure(file_path, city_name):
             print(f"   pos - min: {df['pos'].min():.4f}, max: {df['pos'].max():.4f}, mean: {df['pos'].mean():.4f}")
             print(f"   egg - min: {df['egg'].min():.4f}, max: {df['egg'].max():.4f}, mean: {df['egg'].mean():.4f}")
 
-        # Get full file row count
+        # Get full file row count: count newlines in 1 MiB binary chunks
+        # (bytes.count is a tight C loop) instead of iterating decoded
+        # text lines in Python
         print(f"\n🔢 Full File Statistics:")
-        row_count = sum(1 for _ in open(file_path)) - 1  # Subtract header
+        row_count = 0
+        last_chunk = b''
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                row_count += chunk.count(b'\n')
+                last_chunk = chunk
+        if last_chunk and not last_chunk.endswith(b'\n'):
+            # A final line without a trailing newline still counts as a row
+            row_count += 1
+        row_count -= 1  # Subtract header
         print(f"   - Total rows: {row_count:,}")
 
         return True
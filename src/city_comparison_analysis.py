@@ -3,6 +3,9 @@ import pandas as pd
 import scikit_posthocs as sp
 import os
 
+from core.base_analyzer import kruskal_wallis_from_indices
+from core.data_loader import read_csv_fast
+
 print("Starting city comparison analysis...")
 
 # Load the data
@@ -10,20 +13,19 @@ data_path = 'output/data_with_clusters.csv'
 if not os.path.exists(data_path):
     print(f"Error: {data_path} not found.")
     exit()
-df = pd.read_csv(data_path)
+df = read_csv_fast(data_path)
 
 # --- Kruskal-Wallis and Dunn's Post-Hoc Test ---
 
-def perform_comparison(dataframe, target_col):
+def perform_comparison(dataframe, target_col, group_indices):
     """Performs Kruskal-Wallis and Dunn's post-hoc test for a given target column."""
     print(f"\n--- Analysis for: {target_col.upper()} ---")
-    
-    # Kruskal-Wallis test to see if there's any significant difference among all cities
-    # We need to import the function from scipy.stats
-    from scipy.stats import kruskal
-    
-    city_groups = [group[target_col].values for name, group in dataframe.groupby('縣市')]
-    h_stat, p_val = kruskal(*city_groups)
+
+    # Kruskal-Wallis test to see if there's any significant difference
+    # among all cities; ranks the column once and reads the group rank
+    # sums through the precomputed positional indices
+    h_stat, p_val = kruskal_wallis_from_indices(
+        dataframe[target_col].to_numpy(), group_indices)
     
     print(f"Kruskal-Wallis H-test result:")
     print(f"  H-statistic: {h_stat:.2f}")
@@ -42,9 +44,11 @@ def perform_comparison(dataframe, target_col):
     else:
         print("  -> No statistically significant difference found between cities.")
 
-# Perform the analysis for both 'pos' and 'egg'
-perform_comparison(df, 'pos')
-perform_comparison(df, 'egg')
+# Perform the analysis for both 'pos' and 'egg', grouping the rows by
+# city once (dict of label -> positional index array)
+city_indices = df.groupby('縣市', sort=False).indices
+perform_comparison(df, 'pos', city_indices)
+perform_comparison(df, 'egg', city_indices)
 
 print("\nCity comparison analysis finished.")
 print("Note: The boxplots visualizing these differences are in 'output/distribution_plots.png' from Step 2.")
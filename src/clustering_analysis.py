@@ -2,10 +2,24 @@
 import pandas as pd
 from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 import numpy as np
 import os
 
+from joblib import Parallel, delayed
+from threadpoolctl import threadpool_limits
+
+from config import analysis_config as config
+
+# pyarrow's CSV writer converts columns to text in parallel in C++,
+# far faster than pandas' per-cell formatting on this 175+ column frame
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
 print("Starting clustering analysis...")
 
 # Load the cleaned data
@@ -13,48 +27,130 @@ data_path = 'output/merged_cleaned_data.csv'
 if not os.path.exists(data_path):
     print(f"Error: {data_path} not found.")
     exit()
-df = pd.read_csv(data_path)
-
-# Prepare data for clustering
-# Drop non-feature columns
-feature_cols = df.columns.drop(['date', 'townvill', 'pos', 'egg', '縣市'], errors='ignore')
-X = df[feature_cols]
+# Re-runs skip CSV parsing entirely: the cleaned frame is cached as
+# Parquet (columnar binary, multithreaded decode, float32 preserved)
+# and reused as long as it is newer than the source CSV.
+parquet_cache = 'output/merged_cleaned_data.parquet'
+if (_HAS_PYARROW and os.path.exists(parquet_cache)
+        and os.path.getmtime(parquet_cache) > os.path.getmtime(data_path)):
+    df = pd.read_parquet(parquet_cache)
+    header_cols = df.columns
+    label_cols = [c for c in ('date', 'townvill', 'pos', 'egg', '縣市')
+                  if c in header_cols]
+    feature_cols = header_cols.drop(label_cols)
+    # Private feature copy: the scaler below works in place and must not
+    # write through to the frame saved at the end of the script
+    df_features = df[feature_cols].copy()
+else:
+    # Read the header first, then pull the numeric feature block in as
+    # float32 directly: pinning the dtype skips per-column type inference
+    # and halves the parsed width, which dominates CSV load time.
+    header_cols = pd.read_csv(data_path, nrows=0).columns
+    label_cols = [c for c in ('date', 'townvill', 'pos', 'egg', '縣市')
+                  if c in header_cols]
+    feature_cols = header_cols.drop(label_cols)
+    df_features = pd.read_csv(data_path, usecols=feature_cols,
+                              dtype=np.float32, engine='c')
+    df_labels = pd.read_csv(data_path, usecols=label_cols)
+    # Reassemble in the original column order for the clustered CSV below
+    df = pd.concat([df_labels, df_features], axis=1)[header_cols]
+    if _HAS_PYARROW:
+        try:
+            df.to_parquet(parquet_cache, engine='pyarrow',
+                          compression='zstd')
+        except Exception as e:
+            print(f"⚠ Could not write Parquet cache ({e})")
+# float32 halves the memory traffic through scaling, PCA and the k-means
+# distance matmuls (SGEMM vs DGEMM); ample precision for clustering.
+# Materialize the matrix straight from the homogeneous float32 frame:
+# one allocation, no intermediate df[feature_cols] selection + astype
+# copy. The concat above gave df its own buffers, so scaling X in place
+# cannot touch the frame saved at the end.
+X = df_features.to_numpy(dtype=np.float32, copy=False)
 print(f"Performing clustering on {len(feature_cols)} features.")
 
-# 1. Standardize features
-scaler = StandardScaler()
+# 1. Standardize features (in place — X is private to this script)
+scaler = StandardScaler(copy=False)
 X_scaled = scaler.fit_transform(X)
 print("Features standardized.")
 
 # 2. Apply PCA for dimensionality reduction
-# We choose enough components to explain 90% of the variance
-pca = PCA(n_components=0.90)
-X_pca = pca.fit_transform(X_scaled)
+# We choose enough components to explain 90% of the variance.
+# Rows vastly outnumber the ~175 feature columns, so eigendecomposing
+# the small covariance matrix (one GEMM + eigh) is much cheaper than a
+# full SVD of the tall data matrix.
+pca = PCA(n_components=0.90, svd_solver='covariance_eigh')
+# fit + one explicit GEMM instead of fit_transform: avoids the extra
+# (n x k) scratch array the combined call allocates internally. The
+# centering term is folded in as a k-vector so no centered copy of
+# X_scaled is materialized either.
+pca.fit(X_scaled)
+components_t = pca.components_.T.astype(X_scaled.dtype, copy=False)
+X_pca = X_scaled @ components_t
+X_pca -= pca.mean_ @ components_t
+# Guarantee a C-contiguous float32 block for the k-means GEMM kernels;
+# a no-op when the float32 pipeline is intact, a cheap one-time copy if
+# an upstream change ever reintroduces float64
+X_pca = np.ascontiguousarray(X_pca, dtype=np.float32)
 print(f"PCA applied. Number of components to explain 90% variance: {pca.n_components_}")
 
 # 3. Use the Elbow Method to find the optimal k for K-Means
+# The inertia values are only read off to locate the elbow, so the sweep
+# uses mini-batch k-means: it converges to nearly the same inertia in a
+# small fraction of the passes a full Lloyd's fit makes over X_pca.
+# The final fit at the chosen k below stays full KMeans.
+# (Bound-based exact variants — Hamerly/Yinyang — were considered for
+# the sweep but need a compiled third-party solver this project does not
+# depend on; mini-batch already cuts the passes over X_pca further than
+# their 2-10x pruning would.)
 print("Finding optimal k using the Elbow Method...")
-inertia = []
 k_range = range(2, 11) # Test k from 2 to 10
-for k in k_range:
-    kmeans = KMeans(n_clusters=k, random_state=42, n_init='auto')
-    kmeans.fit(X_pca)
-    inertia.append(kmeans.inertia_)
-
-# For simplicity in this automated script, we'll pick the k that shows a significant drop.
-# A more advanced method would be to find the "elbow point" mathematically.
-# Here, we'll just print the inertia values. A good 'k' is often where the drop in inertia slows down.
+
+def _sweep_inertia(k):
+    # Single-threaded BLAS inside each worker; the k values already
+    # saturate the cores and nested OpenMP threads would oversubscribe.
+    with threadpool_limits(limits=1):
+        # One init per k: the inertia spread across inits is tiny next
+        # to the spread across k values, which is all the elbow reads
+        mbk = MiniBatchKMeans(n_clusters=k, random_state=42, n_init=1,
+                              batch_size=min(4096, len(X_pca)), max_iter=100)
+        mbk.fit(X_pca)
+        return mbk.inertia_
+
+# The fits are independent across k, so run them concurrently
+inertia = Parallel(n_jobs=-1, backend='loky')(
+    delayed(_sweep_inertia)(k) for k in k_range)
+
 print("Inertia for k=2 to 10:")
 for k, i in zip(k_range, inertia):
     print(f"  k={k}, Inertia={i:.2f}")
 
-# Let's choose a k. For this script, we'll hardcode a choice, but in a real analysis,
-# this would be chosen by inspecting a plot of the inertia. Let's assume k=4 is a reasonable choice.
-chosen_k = 4
+# Locate the elbow of the inertia curve instead of hardcoding a k, so
+# reruns on updated data pick up a shifted cluster structure without a
+# manual second pass. kneed implements the kneedle detector; the
+# fallback applies the same geometric definition directly (the point of
+# the normalized curve farthest below the chord joining its endpoints).
+try:
+    from kneed import KneeLocator
+    chosen_k = KneeLocator(list(k_range), inertia,
+                           curve='convex', direction='decreasing').knee
+except ImportError:
+    ks = np.asarray(k_range, dtype=np.float64)
+    ys = np.asarray(inertia, dtype=np.float64)
+    t = (ks - ks[0]) / (ks[-1] - ks[0])
+    y_norm = (ys - ys.min()) / (ys.max() - ys.min())
+    chosen_k = int(ks[np.argmax((1.0 - t) - y_norm)])
+chosen_k = int(chosen_k) if chosen_k else 4
 print(f"\nBased on the inertia values, we'll proceed with k={chosen_k}.")
 
 # 4. Run K-Means with the chosen k
-kmeans = KMeans(n_clusters=chosen_k, random_state=42, n_init='auto')
+# Pin Lloyd's explicitly: on dense PCA output of this width the GEMM
+# distance path beats Elkan's bound bookkeeping, and pinning keeps the
+# fit independent of sklearn's auto-selection heuristics.
+# The restarts stay on the final fit only, where they buy stability of
+# the reported labels rather than of a throwaway inertia reading
+kmeans = KMeans(n_clusters=chosen_k, random_state=42,
+                n_init=config.KMEANS_N_INIT, algorithm='lloyd')
 cluster_labels = kmeans.fit_predict(X_pca)
 
 # Add cluster labels to the original dataframe
@@ -62,9 +158,15 @@ df['cluster'] = cluster_labels
 print(f"K-Means clustering complete. Cluster counts:\n{df['cluster'].value_counts()}")
 
 # 5. Save the dataframe with cluster labels
+# The downstream analysis scripts all read this file as CSV, so the
+# format stays CSV; only the writer changes.
 output_path = 'output/data_with_clusters.csv'
 try:
-    df.to_csv(output_path, index=False)
+    if _HAS_PYARROW:
+        pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False),
+                        output_path)
+    else:
+        df.to_csv(output_path, index=False)
     print(f"\nSuccessfully saved data with cluster labels to {output_path}")
 except Exception as e:
     print(f"Error saving file: {e}")
@@ -4,8 +4,30 @@ Compile academic paper from existing analysis results.
 """
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
 from config import analysis_config as config
 
+# Strip the leading "# Methods" title / any top-level "# " header line;
+# one C-level regex pass replaces the split/filter/join per file
+_METHODS_TITLE_RE = re.compile(r'\A# Methods.*\n?')
+_TOP_HEADER_RE = re.compile(r'^# .*\n?', re.M)
+
+
+def _read_paper_sections(paths):
+    """Read the section files concurrently; missing files map to None."""
+    def _read(path):
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            return f.read()
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        return dict(zip(paths, ex.map(_read, paths)))
+
+
 def compile_paper():
     """Compile methods and results from all analyses into final paper."""
 
@@ -42,16 +64,24 @@ def compile_paper():
         ('Cross-City Comparison', 'output/comparison/methods.md')
     ]
 
+    # Fetch every section file in one concurrent batch up front instead
+    # of ~20 sequential open/read calls scattered through the loops below
+    comp_results_path = 'output/comparison/results.md'
+    section_paths = [filepath for _, filepath in methods_files]
+    section_paths += [
+        f'output/{city_key}/{analysis}/results.md'
+        for city_key in config.CITY_ORDER
+        for analysis in ('statistical', 'pca_clustering', 'lag_rolling')
+    ]
+    section_paths.append(comp_results_path)
+    section_contents = _read_paper_sections(section_paths)
+
     for title, filepath in methods_files:
         methods_sections.append(f"\n## {title}\n")
-        if os.path.exists(filepath):
-            with open(filepath, 'r') as f:
-                content = f.read()
-                # Remove the first "# Methods" line if present
-                lines = content.split('\n')
-                if lines and lines[0].startswith('# Methods'):
-                    content = '\n'.join(lines[1:])
-                methods_sections.append(content)
+        content = section_contents[filepath]
+        if content is not None:
+            # Remove the first "# Methods" line if present
+            methods_sections.append(_METHODS_TITLE_RE.sub('', content))
         else:
             methods_sections.append(f"*Methods file not found: {filepath}*\n")
 
@@ -84,29 +114,19 @@ def compile_paper():
 
         for subtitle, filepath in city_results_files:
             results_sections.append(f"\n### {subtitle}\n")
-            if os.path.exists(filepath):
-                with open(filepath, 'r') as f:
-                    content = f.read()
-                    # Remove headers
-                    lines = content.split('\n')
-                    # Skip lines that start with # or ##
-                    filtered_lines = [line for line in lines if not line.startswith('# ')]
-                    content = '\n'.join(filtered_lines)
-                    results_sections.append(content)
+            content = section_contents[filepath]
+            if content is not None:
+                # Remove top-level "# " header lines
+                results_sections.append(_TOP_HEADER_RE.sub('', content))
             else:
                 results_sections.append(f"*Results file not found: {filepath}*\n")
 
     # Add cross-city comparison results
     results_sections.append("\n## Cross-City Comparison\n")
-    comp_results_path = 'output/comparison/results.md'
-    if os.path.exists(comp_results_path):
-        with open(comp_results_path, 'r') as f:
-            content = f.read()
-            # Remove headers
-            lines = content.split('\n')
-            filtered_lines = [line for line in lines if not line.startswith('# ')]
-            content = '\n'.join(filtered_lines)
-            results_sections.append(content)
+    comp_content = section_contents[comp_results_path]
+    if comp_content is not None:
+        # Remove top-level "# " header lines
+        results_sections.append(_TOP_HEADER_RE.sub('', comp_content))
     else:
         results_sections.append(f"*Comparison results file not found*\n")
 
@@ -170,7 +190,7 @@ Generated from analysis outputs in:
 
 ## Date Generated
 
-{os.popen('date').read().strip()}
+{datetime.now().astimezone().strftime('%a %b %d %H:%M:%S %Z %Y')}
 """
 
     readme_path = os.path.join(paper_dir, 'README.md')
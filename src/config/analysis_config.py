@@ -5,7 +5,9 @@ This module contains all configuration parameters for analyzing mosquito surveil
 data across four cities (Taipei, Kaohsiung, Pingtung, Tainan).
 """
 
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Base directory
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -127,6 +129,19 @@ BONFERRONI_CORRECTED_ALPHA = BONFERRONI_ALPHA / TOTAL_FEATURES  # 0.000286
 # Number of top correlations to report
 N_TOP_CORRELATIONS = 20
 
+# Report p-values alongside lag correlations; disable to skip the
+# t-distribution tail evaluation when only ρ is needed (e.g. sweeps)
+REPORT_PVALUES = True
+
+# Minimum target-valid rows before lag correlations are offloaded to the
+# GPU (requires cuDF); below this the host-device transfer outweighs the
+# device kernel
+CUDF_MIN_ROWS = 10000
+
+# Minimum clean feature columns before the correlation rank pass is
+# spread across joblib threads; below this the pool overhead dominates
+CORR_PARALLEL_MIN_FEATURES = 64
+
 # Number of features to show in heatmaps
 N_HEATMAP_FEATURES = 30
 
@@ -155,9 +170,18 @@ CLUSTERING_K_RANGE = list(range(CLUSTERING_K_MIN, CLUSTERING_K_MAX + 1))
 KMEANS_N_INIT = 100  # Number of initializations (for stability)
 KMEANS_MAX_ITER = 300  # Maximum iterations
 
+# Warm-start the k sweep: fit the smallest k with full KMEANS_N_INIT,
+# then seed each k+1 from the previous centers plus the farthest point
+# (single init). Disable to re-run every k independently from scratch
+KMEANS_WARM_START = True
+
 # Clustering validation metrics
 CLUSTERING_METRICS = ['silhouette', 'calinski_harabasz', 'davies_bouldin']
 
+# Silhouette is O(n²); during the k sweep it is scored on a uniform
+# subsample of at most this many points, which is ample for selecting k
+SILHOUETTE_SAMPLE_SIZE = 5000
+
 # t-SNE parameters for visualization
 TSNE_PERPLEXITY = 30
 TSNE_MAX_ITER = 1000
@@ -176,6 +200,7 @@ UNIVERSAL_PREDICTOR_P_THRESHOLD = 0.001  # p < 0.001
 # ==============================================================================
 
 # Figure settings
+GENERATE_FIGURES = True  # Disable to skip plotting in headless sweeps
 FIGURE_DPI = 300  # Publication quality
 FIGURE_FORMAT = 'png'  # Primary format (can also export to PDF)
 
@@ -208,6 +233,20 @@ CITY_OUTPUT_STRUCTURE = {
 # Comparison output directory
 COMPARISON_OUTPUT_DIR = os.path.join(OUTPUT_DIR, 'comparison')
 
+# Disk cache for cross-city comparison results, keyed by a content hash
+# of the per-city inputs; oldest entries are evicted beyond the cap
+COMPARISON_CACHE_DIR = os.path.join(OUTPUT_DIR, '.cache', 'comparison')
+COMPARISON_CACHE_MAX_ENTRIES = 8
+
+# Disk cache for per-city standardization + PCA fits, keyed by a
+# content hash of the cleaned feature matrix; the reduced matrix is
+# memory-mapped on reuse
+PCA_CACHE_DIR = os.path.join(OUTPUT_DIR, '.cache', 'pca')
+
+# Disk cache for per-city Spearman correlation tables (Parquet), keyed
+# by a content hash of the feature/target columns
+STATS_CACHE_DIR = os.path.join(OUTPUT_DIR, '.cache', 'spearman')
+
 # Compiled paper output directory
 PAPER_OUTPUT_DIR = os.path.join(OUTPUT_DIR, 'compiled_paper')
 
@@ -263,14 +302,18 @@ def get_city_output_dir(city_key, analysis_type=None):
         return os.path.join(OUTPUT_DIR, city_name_en, CITY_OUTPUT_STRUCTURE[analysis_type])
 
 
+@functools.lru_cache(maxsize=1)
 def get_feature_columns_pattern():
     """
     Get list of all feature column patterns.
 
+    The pattern list never changes at runtime, so it is built once and
+    memoized as an immutable tuple; per-city callers hit the cache.
+
     Returns
     -------
-    list
-        List of feature column patterns for dynamic matching
+    tuple
+        Feature column patterns for dynamic matching
     """
     patterns = []
 
@@ -296,22 +339,35 @@ def get_feature_columns_pattern():
     # Demographic features
     patterns.extend(FEATURE_GROUPS['demographic']['variables'])
 
-    return patterns
+    return tuple(patterns)
+
+
+# Precomputed at import so scripts can index dataframes with a constant
+# (pre-hashed by pandas) instead of rebuilding the list per call
+FEATURE_COLUMNS = get_feature_columns_pattern()
 
 
 def validate_config():
     """
     Validate configuration parameters.
 
+    Set SKIP_CONFIG_VALIDATE=1 to bypass the data-file checks entirely
+    (e.g. when only compiling outputs that are already on disk).
+
     Raises
     ------
     ValueError
         If configuration is invalid
     """
-    # Check city paths exist
-    for city_key, city_info in CITIES.items():
-        if not os.path.exists(city_info['path']):
-            raise ValueError(f"Data file not found for {city_info['name_en']}: {city_info['path']}")
+    # Check city paths exist. The stat() calls run concurrently so that
+    # on a network filesystem startup waits for one round-trip, not four.
+    if os.getenv('SKIP_CONFIG_VALIDATE') != '1':
+        cities = list(CITIES.values())
+        with ThreadPoolExecutor(max_workers=len(cities)) as ex:
+            exists = list(ex.map(os.path.exists, (c['path'] for c in cities)))
+        for city_info, ok in zip(cities, exists):
+            if not ok:
+                raise ValueError(f"Data file not found for {city_info['name_en']}: {city_info['path']}")
 
     # Check parameter consistency
     if BONFERRONI_CORRECTED_ALPHA <= 0:
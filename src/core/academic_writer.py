@@ -284,10 +284,12 @@ class AcademicWriter:
         lines.append(header)
         lines.append(separator)
 
-        # Rows
-        for _, row in df.iterrows():
-            row_str = "| " + " | ".join(str(v) for v in row.values) + " |"
-            lines.append(row_str)
+        # Rows: column-level conversion instead of per-cell Python calls.
+        # astype(str) alone keeps NaN/NA as missing values rather than
+        # text, so mask them to 'nan' first or the join raises TypeError.
+        values = (df.astype(object).where(df.notna(), 'nan')
+                  .astype(str).to_numpy())
+        lines.extend("| " + " | ".join(row) + " |" for row in values)
 
         return "\n".join(lines)
 
@@ -7,6 +7,7 @@ It enforces a consistent interface and provides common functionality.
 """
 
 from abc import ABC, abstractmethod
+import io
 import os
 import pandas as pd
 import numpy as np
@@ -16,6 +17,27 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import analysis_config as config
 
+# numexpr fuses elementwise formulas into one multithreaded pass with no
+# intermediate arrays; plain numpy remains the fallback
+try:
+    import numexpr as ne
+    _HAS_NUMEXPR = True
+except ImportError:
+    _HAS_NUMEXPR = False
+
+# pyarrow's CSV writer formats cells multithreaded in C++; used for
+# large frames only, pandas to_csv remains the default
+try:
+    import pyarrow as _pa
+    import pyarrow.csv as _pacsv
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# Row count above which _save_dataframe switches to the pyarrow writer;
+# small frames are not worth the Arrow conversion
+_ARROW_CSV_MIN_ROWS = 10000
+
 
 class BaseAnalyzer(ABC):
     """
@@ -126,7 +148,7 @@ class BaseAnalyzer(ABC):
         os.makedirs(output_dir, exist_ok=True)
         return os.path.abspath(output_dir)
 
-    def _save_dataframe(self, df, output_dir, filename):
+    def _save_dataframe(self, df, output_dir, filename, **to_csv_kwargs):
         """
         Save dataframe to CSV file.
 
@@ -138,6 +160,9 @@ class BaseAnalyzer(ABC):
             Output directory
         filename : str
             Filename (should include .csv extension)
+        **to_csv_kwargs
+            Extra keyword arguments forwarded to ``DataFrame.to_csv``
+            (e.g. ``float_format='%.6g'`` for compact output)
 
         Returns
         -------
@@ -145,7 +170,13 @@ class BaseAnalyzer(ABC):
             Path to saved file
         """
         filepath = os.path.join(output_dir, filename)
-        df.to_csv(filepath, index=False)
+        if _HAS_PYARROW and len(df) > _ARROW_CSV_MIN_ROWS and not to_csv_kwargs:
+            # Multithreaded C++ cell formatting; only taken for plain
+            # dumps, since Arrow has no float_format equivalent
+            _pacsv.write_csv(_pa.Table.from_pandas(df, preserve_index=False),
+                             filepath)
+        else:
+            df.to_csv(filepath, index=False, **to_csv_kwargs)
         print(f"  ✓ Saved: {filename}")
         return filepath
 
@@ -155,8 +186,9 @@ class BaseAnalyzer(ABC):
 
         Parameters
         ----------
-        fig : matplotlib.figure.Figure
-            Figure to save
+        fig : matplotlib.figure.Figure or bytes
+            Figure to save, or already-rendered PNG bytes (from analyzers
+            that render eagerly and close their figures to free memory)
         output_dir : str
             Output directory
         filename : str
@@ -169,14 +201,57 @@ class BaseAnalyzer(ABC):
         str
             Path to saved file
         """
-        if dpi is None:
-            dpi = config.FIGURE_DPI
-
         filepath = os.path.join(output_dir, filename)
-        fig.savefig(filepath, dpi=dpi, bbox_inches='tight')
+
+        if isinstance(fig, (bytes, bytearray)):
+            with open(filepath, 'wb') as f:
+                f.write(fig)
+        else:
+            if dpi is None:
+                dpi = config.FIGURE_DPI
+            fig.savefig(filepath, dpi=dpi, bbox_inches='tight')
+
         print(f"  ✓ Saved: {filename}")
         return filepath
 
+    def _render_figure(self, fig, dpi=None, close=True):
+        """
+        Render a figure to PNG bytes and (by default) close it.
+
+        Allows analyzers to free Figure objects as soon as they are drawn
+        while still deferring the actual file write to save_outputs();
+        _save_figure accepts the returned bytes directly. Analyzers that
+        pool a figure across calls pass ``close=False`` and clear it
+        themselves.
+
+        Parameters
+        ----------
+        fig : matplotlib.figure.Figure
+            Figure to render
+        dpi : int, optional
+            DPI for the rasterization (default: from config)
+        close : bool, default=True
+            Close the figure after rendering
+
+        Returns
+        -------
+        bytes
+            PNG-encoded figure
+        """
+        if dpi is None:
+            dpi = config.FIGURE_DPI
+
+        buf = io.BytesIO()
+        # compress_level 3 encodes noticeably faster than the zlib
+        # default (6) at a small file-size cost; drop default metadata
+        fig.savefig(buf, format='png', dpi=dpi, bbox_inches='tight',
+                    pil_kwargs={'compress_level': 3},
+                    metadata={'Software': None})
+        if close:
+            import matplotlib.pyplot as plt
+            plt.close(fig)
+        return buf.getvalue()
+
     def _save_text(self, text, output_dir, filename):
         """
         Save text content to file.
@@ -358,6 +433,10 @@ def calculate_correlation(df, features, target, method='spearman'):
     """
     Calculate correlations between features and target.
 
+    Only the features-against-target column is ever computed (F pairs);
+    no caller should fall back to a full F x F ``DataFrame.corr`` matrix
+    when this slice is all that is consumed.
+
     Parameters
     ----------
     df : pandas.DataFrame
@@ -378,6 +457,12 @@ def calculate_correlation(df, features, target, method='spearman'):
     """
     from scipy import stats
 
+    if method == 'spearman':
+        return _spearman_correlation_batch(df, features, target)
+
+    if method != 'pearson':
+        raise ValueError(f"Unknown correlation method: {method}")
+
     correlations = {}
     p_values = {}
 
@@ -388,13 +473,7 @@ def calculate_correlation(df, features, target, method='spearman'):
         y = df.loc[valid_mask, target]
 
         if len(x) > 0:
-            if method == 'spearman':
-                corr, pval = stats.spearmanr(x, y)
-            elif method == 'pearson':
-                corr, pval = stats.pearsonr(x, y)
-            else:
-                raise ValueError(f"Unknown correlation method: {method}")
-
+            corr, pval = stats.pearsonr(x, y)
             correlations[feature] = corr
             p_values[feature] = pval
         else:
@@ -404,6 +483,257 @@ def calculate_correlation(df, features, target, method='spearman'):
     return pd.Series(correlations), pd.Series(p_values)
 
 
+def calculate_correlations_multi(df, features, targets, method='spearman'):
+    """
+    Correlate features against several targets, sharing the feature ranks.
+
+    When every target column is fully observed, the pairwise-complete row
+    set is the same for all targets, so the feature rank matrix only needs
+    to be computed once: all targets are appended to it and correlated in
+    a single ``corrcoef`` call. If any target contains NaN (different row
+    subsets per target) or a non-spearman method is requested, this falls
+    back to one :func:`calculate_correlation` call per target.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Input data
+    features : list
+        List of feature column names
+    targets : list
+        Target column names (each must exist in ``df``)
+    method : str, default='spearman'
+        Correlation method ('spearman' or 'pearson')
+
+    Returns
+    -------
+    dict
+        ``{target: (correlations, p_values)}`` with the same Series as
+        :func:`calculate_correlation` would return for that target
+    """
+    from scipy import stats
+
+    if method != 'spearman' or df[targets].isna().any().any():
+        return {t: calculate_correlation(df, features, t, method=method)
+                for t in targets}
+
+    # Fortran order makes each feature column contiguous, so the
+    # column-wise NaN scan and rank pass below stream through memory;
+    # float32 halves that traffic and ranks/correlations are still
+    # accumulated in float64 downstream (rankdata returns float64).
+    # NaN handling stays pairwise-complete on purpose: a single listwise
+    # dropna over all features would silently shrink the sample behind
+    # every coefficient whenever one column has holes.
+    mat = np.asfortranarray(df[features].to_numpy(dtype=np.float32))
+    y_mat = df[targets].to_numpy(dtype=np.float64)
+    n_feat = len(features)
+    n_tgt = len(targets)
+
+    corr_arr = np.full((n_feat, n_tgt), np.nan)
+    n_arr = np.zeros(n_feat, dtype=np.int64)
+
+    if len(df) > 0:
+        y_ranks = stats.rankdata(y_mat, axis=0)
+        col_has_nan = np.isnan(mat).any(axis=0)
+        clean_cols = np.flatnonzero(~col_has_nan)
+        nan_cols = np.flatnonzero(col_has_nan)
+
+        min_parallel = getattr(config, 'CORR_PARALLEL_MIN_FEATURES', 64)
+        if clean_cols.size >= min_parallel:
+            # Ranking is independent per column, so fan the rank pass out
+            # over column blocks; threads suffice because argsort releases
+            # the GIL, and they share mat without pickling
+            from joblib import Parallel, delayed
+
+            n_blocks = min(os.cpu_count() or 1, clean_cols.size)
+            ranks = np.hstack(Parallel(n_jobs=-1, backend='threading')(
+                delayed(stats.rankdata)(mat[:, block], axis=0)
+                for block in np.array_split(clean_cols, n_blocks)
+            ))
+        elif clean_cols.size > 0:
+            ranks = stats.rankdata(mat[:, clean_cols], axis=0)
+
+        if clean_cols.size > 0:
+            stacked = np.column_stack([ranks, y_ranks])
+            with np.errstate(invalid='ignore'):
+                full = np.corrcoef(stacked, rowvar=False)
+            corr_arr[clean_cols, :] = full[:-n_tgt, -n_tgt:]
+            n_arr[clean_cols] = len(df)
+
+        for j in nan_cols:
+            pair_mask = ~np.isnan(mat[:, j])
+            n_pair = int(pair_mask.sum())
+            n_arr[j] = n_pair
+            if n_pair > 0:
+                x_rank = stats.rankdata(mat[pair_mask, j])
+                with np.errstate(invalid='ignore'):
+                    for ti in range(n_tgt):
+                        corr_arr[j, ti] = np.corrcoef(
+                            x_rank,
+                            stats.rankdata(y_mat[pair_mask, ti]))[0, 1]
+
+    return {
+        t: (pd.Series(corr_arr[:, ti], index=features),
+            pd.Series(_spearman_pvalues(corr_arr[:, ti], n_arr),
+                      index=features))
+        for ti, t in enumerate(targets)
+    }
+
+
+def _spearman_pvalues(corr_arr, n_arr):
+    """
+    Vectorized two-sided p-values for Spearman correlations.
+
+    Uses the same t-distribution approximation as scipy.stats.spearmanr.
+
+    Parameters
+    ----------
+    corr_arr : numpy.ndarray
+        Correlation coefficients
+    n_arr : numpy.ndarray
+        Number of observations behind each coefficient
+
+    Returns
+    -------
+    numpy.ndarray
+        P-values (NaN where untestable)
+    """
+    from scipy import stats
+
+    pval_arr = np.full(corr_arr.shape, np.nan)
+    dof = n_arr - 2
+    testable = (dof > 0) & ~np.isnan(corr_arr)
+    if testable.any():
+        rs = corr_arr[testable]
+        dof_t = dof[testable]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if _HAS_NUMEXPR:
+                # One fused pass instead of four numpy temporaries
+                t_stat = ne.evaluate(
+                    'rs * sqrt(dof_t / ((rs + 1.0) * (1.0 - rs)))')
+            else:
+                t_stat = rs * np.sqrt(dof_t / ((rs + 1.0) * (1.0 - rs)))
+        pval_arr[testable] = 2 * stats.t.sf(np.abs(t_stat), dof_t)
+    return pval_arr
+
+
+def _spearman_correlation_batch(df, features, target):
+    """
+    Batched Spearman correlations of many features against one target.
+
+    Equivalent to calling ``scipy.stats.spearmanr`` per feature with
+    pairwise-complete observations, but ranks the target exactly once
+    and correlates all fully-observed features in a single ``corrcoef``
+    call on the rank matrix (Spearman = Pearson on ranks). Only columns
+    that contain NaN fall back to individual pairwise handling, since
+    their ranks depend on which rows are dropped.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Input data
+    features : list
+        List of feature column names
+    target : str
+        Target column name
+
+    Returns
+    -------
+    pandas.Series
+        Correlations (index=feature names)
+    pandas.Series
+        P-values (index=feature names)
+    """
+    from scipy import stats
+
+    target_valid = df[target].notna().to_numpy()
+    # Column-contiguous float32 for the NaN scan and per-column ranking;
+    # pairwise deletion semantics are kept (see calculate_correlations_multi)
+    mat = np.asfortranarray(
+        df.loc[target_valid, features].to_numpy(dtype=np.float32))
+    y = df.loc[target_valid, target].to_numpy(dtype=np.float64)
+
+    n_feat = len(features)
+    corr_arr = np.full(n_feat, np.nan)
+    n_arr = np.zeros(n_feat, dtype=np.int64)
+
+    if y.size > 0:
+        y_rank = stats.rankdata(y)
+        col_has_nan = np.isnan(mat).any(axis=0)
+        clean_cols = np.flatnonzero(~col_has_nan)
+        nan_cols = np.flatnonzero(col_has_nan)
+
+        if clean_cols.size > 0:
+            ranks = stats.rankdata(mat[:, clean_cols], axis=0)
+            stacked = np.column_stack([ranks, y_rank])
+            with np.errstate(invalid='ignore'):
+                corr_arr[clean_cols] = np.corrcoef(stacked,
+                                                   rowvar=False)[:-1, -1]
+            n_arr[clean_cols] = y.size
+
+        for j in nan_cols:
+            pair_mask = ~np.isnan(mat[:, j])
+            n_pair = int(pair_mask.sum())
+            n_arr[j] = n_pair
+            if n_pair > 0:
+                with np.errstate(invalid='ignore'):
+                    corr_arr[j] = np.corrcoef(
+                        stats.rankdata(mat[pair_mask, j]),
+                        stats.rankdata(y[pair_mask]))[0, 1]
+
+    pval_arr = _spearman_pvalues(corr_arr, n_arr)
+
+    # Pairs with no overlap keep NaN, matching the per-feature behavior
+    empty = n_arr == 0
+    corr_arr[empty] = np.nan
+    pval_arr[empty] = np.nan
+
+    return (pd.Series(corr_arr, index=features),
+            pd.Series(pval_arr, index=features))
+
+
+def kruskal_wallis_from_indices(values, group_indices):
+    """
+    Tie-corrected Kruskal-Wallis H-test over precomputed group indices.
+
+    Numerically equivalent to ``scipy.stats.kruskal`` on the sliced
+    groups, but ranks the column once in its original order and reads
+    per-group rank sums through the positional index arrays — no group
+    list materialization and no internal re-concatenation.
+
+    Parameters
+    ----------
+    values : array-like
+        Observations for all groups combined
+    group_indices : dict
+        ``{label: ndarray of positional indices}`` as returned by
+        ``DataFrame.groupby(...).indices``
+
+    Returns
+    -------
+    float
+        H statistic (tie-corrected)
+    float
+        P-value from the chi-squared approximation
+    """
+    from scipy import stats
+
+    values = np.asarray(values, dtype=np.float64)
+    ranks = stats.rankdata(values)
+    ties = stats.tiecorrect(ranks)
+    if ties == 0:
+        raise ValueError("All numbers are identical in kruskal")
+
+    n = values.size
+    ssbn = 0.0
+    for idx in group_indices.values():
+        ssbn += ranks[idx].sum() ** 2 / idx.size
+
+    h = 12.0 / (n * (n + 1)) * ssbn - 3 * (n + 1)
+    h /= ties
+    return h, stats.chi2.sf(h, len(group_indices) - 1)
+
+
 def bonferroni_correction(p_values, alpha=0.05):
     """
     Apply Bonferroni correction to p-values.